@@ -20,13 +20,9 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Create users table (skip if exists)
-    from sqlalchemy import inspect
-    from alembic import context
+    inspector = sa.inspect(op.get_bind())
     
-    conn = context.get_bind()
-    inspector = inspect(conn)
-    
-    if 'user' not in inspector.get_table_names():
+    if not inspector.has_table('user'):
         op.create_table(
             'user',
             sa.Column('id', sa.Integer(), nullable=False),
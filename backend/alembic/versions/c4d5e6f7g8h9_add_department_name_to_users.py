@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.migration_utils import add_columns
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'c4d5e6f7g8h9'
@@ -20,16 +22,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Add department_name column to user table (skip if exists)
-    from sqlalchemy import inspect
-    from alembic import context
-    
-    conn = context.get_bind()
-    inspector = inspect(conn)
-    
-    # Check if column already exists
-    columns = [col['name'] for col in inspector.get_columns('user')]
-    if 'department_name' not in columns:
-        op.add_column('user', sa.Column('department_name', sa.String(), nullable=True))
+    # Further columns for this table belong in the same call: one ALTER TABLE, one lock
+    add_columns(
+        sa.inspect(op.get_bind()),
+        'user',
+        sa.Column('department_name', sa.String(), nullable=True),
+    )
 
 
 def downgrade() -> None:
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.migration_utils import add_columns
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'd5e6f7g8h9i0'
@@ -20,16 +22,12 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Add assigned_user_name column to asset table (skip if exists)
-    from sqlalchemy import inspect
-    from alembic import context
-    
-    conn = context.get_bind()
-    inspector = inspect(conn)
-    
-    # Check if column already exists
-    columns = [col['name'] for col in inspector.get_columns('asset')]
-    if 'assigned_user_name' not in columns:
-        op.add_column('asset', sa.Column('assigned_user_name', sa.String(), nullable=True))
+    # Further columns for this table belong in the same call: one ALTER TABLE, one lock
+    add_columns(
+        sa.inspect(op.get_bind()),
+        'asset',
+        sa.Column('assigned_user_name', sa.String(), nullable=True),
+    )
 
 
 def downgrade() -> None:
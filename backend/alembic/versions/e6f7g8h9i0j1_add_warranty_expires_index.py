@@ -0,0 +1,27 @@
+"""Add index on asset.warranty_expires
+
+Revision ID: e6f7g8h9i0j1
+Revises: d5e6f7g8h9i0
+Create Date: 2025-01-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f7g8h9i0j1'
+down_revision: Union[str, Sequence[str], None] = 'd5e6f7g8h9i0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Index warranty_expires so the warranty range queries can seek instead of scan
+    op.create_index('ix_asset_warranty_expires', 'asset', ['warranty_expires'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    # Drop warranty_expires index
+    op.drop_index('ix_asset_warranty_expires', table_name='asset', if_exists=True)
@@ -0,0 +1,44 @@
+"""Convert asset.created_at to an indexed timestamp
+
+Revision ID: f7g8h9i0j1k2
+Revises: e6f7g8h9i0j1
+Create Date: 2025-01-22 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.migration_utils import convert_column_in_batches
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7g8h9i0j1k2'
+down_revision: Union[str, Sequence[str], None] = 'e6f7g8h9i0j1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Snipe-IT datetimes are stored as text ("YYYY-MM-DD HH:MM:SS"); parse them into a
+    # new timestamp column, leaving anything unparseable as NULL, then swap columns.
+    convert_column_in_batches(
+        'asset',
+        'created_at',
+        sa.DateTime(),
+        r"CASE "
+        r"WHEN created_at ~ '^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2})?)?' "
+        r"THEN left(created_at, 19)::timestamp END"
+    )
+    op.create_index('ix_asset_created_at', 'asset', ['created_at'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_asset_created_at', table_name='asset')
+    op.alter_column(
+        'asset',
+        'created_at',
+        type_=sa.String(),
+        postgresql_using="to_char(created_at, 'YYYY-MM-DD HH24:MI:SS')"
+    )
@@ -0,0 +1,38 @@
+"""Add partial indexes for the missing-data checks
+
+Revision ID: g8h9i0j1k2l3
+Revises: f7g8h9i0j1k2
+Create Date: 2025-01-24 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'g8h9i0j1k2l3'
+down_revision: Union[str, Sequence[str], None] = 'f7g8h9i0j1k2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Text columns checked by the "missing ..." data-quality queries
+MISSING_CHECK_COLUMNS = ("serial", "asset_tag", "manufacturer", "location")
+
+
+def upgrade() -> None:
+    # One small index per check, holding only the rows with a blank value
+    for column in MISSING_CHECK_COLUMNS:
+        op.create_index(
+            f'ix_asset_missing_{column}',
+            'asset',
+            ['id'],
+            postgresql_where=sa.text(f"coalesce({column}, '') = ''"),
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    for column in MISSING_CHECK_COLUMNS:
+        op.drop_index(f'ix_asset_missing_{column}', table_name='asset', if_exists=True)
@@ -0,0 +1,40 @@
+"""Add trigram indexes for the export table filters
+
+Revision ID: h9i0j1k2l3m4
+Revises: g8h9i0j1k2l3
+Create Date: 2025-01-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h9i0j1k2l3m4'
+down_revision: Union[str, Sequence[str], None] = 'g8h9i0j1k2l3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns matched by the case-insensitive substring table filters
+FILTER_COLUMNS = ("company", "manufacturer", "category", "model", "department")
+
+
+def upgrade() -> None:
+    # lower(col) LIKE '%value%' has a leading wildcard, so a plain btree on
+    # lower(col) can't serve it; a trigram GIN index can
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in FILTER_COLUMNS:
+        op.create_index(
+            f'ix_asset_{column}_lower_trgm',
+            'asset',
+            [sa.text(f'lower({column}) gin_trgm_ops')],
+            postgresql_using='gin',
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    for column in FILTER_COLUMNS:
+        op.drop_index(f'ix_asset_{column}_lower_trgm', table_name='asset', if_exists=True)
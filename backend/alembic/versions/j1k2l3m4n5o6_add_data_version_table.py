@@ -0,0 +1,34 @@
+"""Add data_version table
+
+Revision ID: j1k2l3m4n5o6
+Revises: h9i0j1k2l3m4
+Create Date: 2025-01-30 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j1k2l3m4n5o6'
+down_revision: Union[str, Sequence[str], None] = 'h9i0j1k2l3m4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Single-row counter behind the fun-queries ETags, shared by every worker (skip if exists)
+    if not sa.inspect(op.get_bind()).has_table('data_version'):
+        data_version = op.create_table(
+            'data_version',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('version', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.bulk_insert(data_version, [{'id': 1, 'version': 0}])
+
+
+def downgrade() -> None:
+    op.drop_table('data_version')
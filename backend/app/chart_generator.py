@@ -7,13 +7,34 @@ import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for server-side generation
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import numpy as np
 from io import BytesIO
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime, date
-from collections import Counter, defaultdict
+from collections import defaultdict, OrderedDict
 import calendar
+import hashlib
+import logging
+import math
+import os
+import tempfile
+import sys
+import time
+from itertools import repeat
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+from sqlalchemy import func, case, extract, and_, or_
+from sqlmodel import Session, select
 
 from .models import Asset
+from .settings import settings
+
+logger = logging.getLogger(__name__)
 
 # Color scheme matching frontend dashboard
 COLORS = {
@@ -42,14 +63,490 @@ STATUS_COLORS = {
     'stolen': '#808b96'
 }
 
+# Lookup keyed by normalized (lowercase) status, built once at import
+_STATUS_COLORS_LOWER = {status.lower(): color for status, color in STATUS_COLORS.items()}
+
+# Statuses shown on the dashboard charts
+DASHBOARD_STATUSES = ['Active', 'Stock', 'Pending Rebuild']
+
+# Trend series key for each dashboard status
+TREND_SERIES = {'Active': 'active', 'Pending Rebuild': 'pending', 'Stock': 'stock'}
+
+
+def _configure_mpl() -> None:
+    """Set chart style and rendering rcParams once per process (render pool workers included)."""
+    plt.style.use('default')
+    plt.rcParams['font.family'] = 'DejaVu Sans'  # Bundled with matplotlib, resolved once
+    plt.rcParams['axes.unicode_minus'] = False
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+
+
 # Chart style configuration
-plt.style.use('default')
+_configure_mpl()
+
+
+# Part of every PNG cache key. Bump it with any change to how charts are drawn,
+# so PNGs rendered by the previous code (which survive restarts on disk) stop matching.
+_RENDER_VERSION = 1
+
+# On-disk PNGs unused for this long are removed, as are the least recently used
+# beyond _DISK_MAX_FILES; each process prunes at most once per _DISK_PRUNE_INTERVAL
+_DISK_MAX_AGE = 7 * 24 * 3600.0
+_DISK_MAX_FILES = 2000
+_DISK_PRUNE_INTERVAL = 3600.0
+
+
+class _PNGCache:
+    """
+    Small thread-safe LRU of rendered chart PNG bytes. With a directory it is
+    backed by content-addressed files there, which survive restarts and are
+    shared by every worker process; a file's mtime marks its last use.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 64,
+        directory: Optional[str] = None,
+        max_age: float = _DISK_MAX_AGE,
+        max_files: int = _DISK_MAX_FILES,
+    ):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_age = max_age
+        self.max_files = max_files
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_prune = 0.0
+    
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            png = self._items.get(key)
+            if png is not None:
+                self._items.move_to_end(key)
+                return png
+        png = self._read_file(key)
+        if png is not None:
+            self._remember(key, png)
+        return png
+    
+    def put(self, key, png: bytes) -> None:
+        self._remember(key, png)
+        self._write_file(key, png)
+    
+    def _remember(self, key, png: bytes) -> None:
+        with self._lock:
+            self._items[key] = png
+            self._items.move_to_end(key)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+    
+    def _path(self, key) -> str:
+        # Keys are tuples of plain values, so their repr is stable across processes
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=20).hexdigest()
+        return os.path.join(self.directory, f"{digest}.png")
+    
+    def _read_file(self, key) -> Optional[bytes]:
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                png = f.read()
+            os.utime(path)
+            return png
+        except FileNotFoundError:
+            return None
+        except OSError:
+            logger.warning("Could not read cached chart", exc_info=True)
+            return None
+    
+    def _write_file(self, key, png: bytes) -> None:
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial PNG
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(png)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            logger.warning("Could not write cached chart", exc_info=True)
+        
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._next_prune = now + _DISK_PRUNE_INTERVAL
+            self.prune()
+    
+    def prune(self) -> None:
+        """Delete on-disk PNGs (and stray temp files) past max_age or beyond max_files."""
+        if not self.directory:
+            return
+        cutoff = time.time() - self.max_age
+        files = []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.png', '.tmp')):
+                        try:
+                            files.append((entry.stat().st_mtime, entry.path))
+                        except FileNotFoundError:
+                            pass  # removed by another worker meanwhile
+        except OSError:
+            logger.warning("Could not scan the chart cache", exc_info=True)
+            return
+        files.sort(reverse=True)  # most recently used first
+        for index, (mtime, path) in enumerate(files):
+            if index >= self.max_files or mtime < cutoff:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    logger.warning("Could not remove cached chart", exc_info=True)
+
+
+_PNG_CACHE = _PNGCache(maxsize=64, directory=settings.chart_cache_dir)
+
+# Per-thread Figures keyed by figsize, reused across charts instead of
+# creating and closing a pyplot figure for every render
+_FIGURES = threading.local()
+
+
+def _get_reusable_fig(figsize: tuple) -> Figure:
+    """Return this thread's cleared Figure for the given size, creating it on first use."""
+    figures = getattr(_FIGURES, 'by_size', None)
+    if figures is None:
+        figures = _FIGURES.by_size = {}
+    fig = figures.get(figsize)
+    if fig is None:
+        # Constrained layout is solved once per draw, replacing tight_layout()
+        # plus bbox_inches='tight' (which lays the figure out a second time)
+        fig = Figure(figsize=figsize, layout='constrained')
+        FigureCanvasAgg(fig)
+        figures[figsize] = fig
+    else:
+        fig.clear()
+    return fig
+
+
+def _freeze(data: Any) -> Any:
+    """Turn (nested) aggregate dicts into hashable tuples for use as a cache key."""
+    if isinstance(data, dict):
+        return tuple((key, _freeze(value)) for key, value in data.items())
+    return data
+
+
+# Aggregate statements are built once at import; per call only the optional
+# criteria are appended, so SQLAlchemy's compiled cache hits on every export.
+_CATEGORY_LABEL = func.lower(func.coalesce(func.nullif(Asset.category, ''), 'Unknown'))
+_CATEGORY_COUNT_STMT = (
+    select(_CATEGORY_LABEL, func.count())
+    .group_by(_CATEGORY_LABEL)
+    .order_by(_CATEGORY_LABEL)
+)
+
+_STATUS_LABEL = func.lower(Asset.status)
+_STATUS_COUNT_STMT = (
+    select(_STATUS_LABEL, func.count())
+    .where(Asset.status.in_(DASHBOARD_STATUSES))  # type: ignore
+    .group_by(_STATUS_LABEL)
+    .order_by(_STATUS_LABEL)
+)
+
+# Display label per normalized category, interned the first time each value is seen
+_CATEGORY_LABELS: Dict[str, str] = {}
+
+_CREATED_MONTH = func.date_trunc('month', Asset.created_at)
+_MONTHLY_STATUS_STMT = (
+    select(_CREATED_MONTH, Asset.status, func.count())
+    .where(
+        Asset.status.in_(DASHBOARD_STATUSES),  # type: ignore
+        Asset.created_at.is_not(None),  # type: ignore
+    )
+    .group_by(_CREATED_MONTH, Asset.status)
+    .order_by(_CREATED_MONTH)
+)
+
+
+def _category_label(value: str) -> str:
+    """Interned title-case label for a lowercased category."""
+    label = _CATEGORY_LABELS.get(value)
+    if label is None:
+        label = _CATEGORY_LABELS[value] = sys.intern(value.title())
+    return label
+
+
+def _category_counts(session: Session, criteria: Sequence[Any] = ()) -> Dict[str, int]:
+    """Count assets per category with a single GROUP BY, keyed by display label."""
+    statement = _CATEGORY_COUNT_STMT.where(*criteria)
+    return {_category_label(value): count for value, count in session.exec(statement)}
+
+
+def _status_counts(session: Session, criteria: Sequence[Any] = ()) -> Dict[str, int]:
+    """Count dashboard-status assets per status, keyed by lowercased status."""
+    statement = _STATUS_COUNT_STMT.where(*criteria)
+    # Lowercased in SQL; interning keeps the color lookups on identical string objects
+    return {sys.intern(status): count for status, count in session.exec(statement)}
+
+
+def _monthly_status_counts(session: Session, criteria: Sequence[Any] = ()) -> Dict[datetime, Dict[str, int]]:
+    """Count dashboard-status assets per creation month and status, ordered by month."""
+    statement = _MONTHLY_STATUS_STMT.where(*criteria)
+    # Pivot (month, status) -> count rows into one dict per month
+    monthly_data: Dict[datetime, Dict[str, int]] = {}
+    for month_start, status, count in session.exec(statement):
+        series = monthly_data.setdefault(month_start, {'active': 0, 'pending': 0, 'stock': 0})
+        series[TREND_SERIES[status]] += count
+    return monthly_data
+
+
+def _warranty_model_key():
+    """SQL expression bucketing laptops into the chart's model series."""
+    manufacturer = func.lower(func.coalesce(Asset.manufacturer, ''))
+    model = func.lower(func.coalesce(Asset.model, ''))
+    return case(
+        # Group Apple laptops by chip generation
+        (and_(manufacturer.contains('apple'), model.contains('m4')), 'Apple M4'),
+        (and_(manufacturer.contains('apple'), model.contains('m3')), 'Apple M3'),
+        (and_(manufacturer.contains('apple'), model.contains('m2')), 'Apple M2'),
+        (and_(manufacturer.contains('apple'), model.contains('m1')), 'Apple M1'),
+        (manufacturer.contains('apple'), 'Apple Other'),
+        # Identify specific X13 generation
+        (or_(model.contains('gen1'), model.contains('gen 1')), 'Lenovo X13 Gen1'),
+        (or_(model.contains('gen2'), model.contains('gen 2')), 'Lenovo X13 Gen2'),
+        (or_(model.contains('gen4'), model.contains('gen 4')), 'Lenovo X13 Gen4'),
+        else_='Lenovo X13',
+    )
+
+
+def _warranty_count_statement():
+    """
+    Expiring laptop warranties per quarter and model series.
+    Only includes Apple laptops and Lenovo X13 Gen1, Gen2 and Gen4.
+    """
+    manufacturer = func.lower(func.coalesce(Asset.manufacturer, ''))
+    model = func.lower(func.coalesce(Asset.model, ''))
+    year = extract('year', Asset.warranty_expires)
+    quarter = extract('quarter', Asset.warranty_expires)
+    model_key = _warranty_model_key()
+    
+    return (
+        select(year, quarter, model_key, func.count())
+        .where(
+            func.lower(Asset.category).contains('laptop'),
+            Asset.warranty_expires.is_not(None),  # type: ignore
+            or_(
+                manufacturer.contains('apple'),
+                and_(
+                    manufacturer.contains('lenovo'),
+                    model.contains('x13'),
+                    or_(*(model.contains(gen) for gen in ['gen1', 'gen 1', 'gen2', 'gen 2', 'gen4', 'gen 4'])),
+                ),
+            ),
+        )
+        .group_by(year, quarter, model_key)
+        .order_by(year, quarter, model_key)
+    )
+
+
+_WARRANTY_COUNT_STMT = _warranty_count_statement()
+
+
+def _quarterly_warranty_counts(session: Session, criteria: Sequence[Any] = ()) -> Dict[Tuple[int, int], Dict[str, int]]:
+    """Count expiring laptop warranties per (year, quarter) and model series."""
+    statement = _WARRANTY_COUNT_STMT.where(*criteria)
+    quarterly_data = defaultdict(dict)
+    for exp_year, exp_quarter, key, count in session.exec(statement):
+        quarterly_data[(int(exp_year), int(exp_quarter))][key] = count
+    return quarterly_data
+
+
+# Aggregate query and empty-data message for each chart type
+_CHART_AGGREGATES = {
+    'category': (_category_counts, "No category data available"),
+    'status': (_status_counts, "No status data available"),
+    'trends': (_monthly_status_counts, "No trend data available"),
+    'warranty': (_quarterly_warranty_counts, "No warranty expiration data available"),
+}
+
+
+def _aggregate(chart_type: str, session: Session, criteria: Sequence[Any] = ()) -> Tuple[str, Any]:
+    """Run the aggregate query for a chart type, returning the (kind, data) to plot."""
+    aggregate, empty_message = _CHART_AGGREGATES[chart_type]
+    data = aggregate(session, criteria)
+    if not data:
+        return 'empty', empty_message
+    return chart_type, data
+
+
+def _render_png(kind: str, data: Any, dpi: int, figsize: tuple) -> bytes:
+    """Plot one chart to PNG bytes. Module-level so it can run in the render pool."""
+    return getattr(ChartGenerator(dpi=dpi, figsize=figsize), f'_plot_{kind}')(data).getvalue()
+
+
+_RENDER_POOL: Optional[ProcessPoolExecutor] = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Lazily start the process pool used to rasterize charts in parallel."""
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        if _RENDER_POOL is None:
+            # spawn rather than fork: the parent holds DB connections and scheduler threads
+            _RENDER_POOL = ProcessPoolExecutor(
+                max_workers=4,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _RENDER_POOL
+
+
+def shutdown_render_pool() -> None:
+    """Stop the render pool's worker processes, if it was started; the next render starts a new one."""
+    global _RENDER_POOL
+    with _RENDER_POOL_LOCK:
+        pool, _RENDER_POOL = _RENDER_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# Chart kinds emitted directly as SVG instead of being rasterized by matplotlib
+SVG_KINDS = frozenset({'category', 'status'})
+
+_SVG_FONT = 'font-family="Helvetica"'
+
+
+def _nice_step(max_value: float, target_ticks: int = 5) -> float:
+    """Round gridline step (1, 2 or 5 x 10^n) giving about `target_ticks` ticks up to max_value."""
+    raw = max(max_value, 1) / target_ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for multiple in (1, 2, 5, 10):
+        if raw <= multiple * magnitude:
+            return multiple * magnitude
+    return 10 * magnitude
+
+
+def _svg_document(width: float, height: float, title: str, body: List[str]) -> bytes:
+    """Wrap SVG elements in a white-background document with a centered chart title."""
+    return '\n'.join([
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:g}" height="{height:g}" '
+        f'viewBox="0 0 {width:g} {height:g}">',
+        f'<rect x="0" y="0" width="{width:g}" height="{height:g}" fill="white"/>',
+        f'<text x="{width / 2:.1f}" y="30" text-anchor="middle" {_SVG_FONT} font-size="16" '
+        f'font-weight="bold" fill="{COLORS["dark"]}">{escape(title)}</text>',
+        *body,
+        '</svg>',
+    ]).encode('utf-8')
+
+
+def _render_bar_svg(labels: Sequence[str], counts: Sequence[int], colors: Sequence[str],
+                    size: Tuple[float, float], title: str = 'Assets by Category',
+                    xlabel: str = 'Category', ylabel: str = 'Asset Count') -> bytes:
+    """Bar chart as an SVG document, one <rect> and value label per bar."""
+    width, height = size
+    rotate = len(labels) > 5
+    left, right, top, bottom = 70, 20, 60, (110 if rotate else 60)
+    plot_w, plot_h = width - left - right, height - top - bottom
+    base_y = top + plot_h
+
+    step = _nice_step(max(counts))
+    y_max = step * math.ceil(max(max(counts), 1) / step)
+    scale = plot_h / y_max
+
+    body = []
+    # Dashed gridlines with y tick labels
+    tick = 0.0
+    while tick <= y_max:
+        y = base_y - tick * scale
+        body.append(f'<line x1="{left}" y1="{y:.1f}" x2="{left + plot_w:.1f}" y2="{y:.1f}" '
+                    f'stroke="{COLORS["gray"]}" stroke-opacity="0.3" stroke-dasharray="4,3"/>')
+        body.append(f'<text x="{left - 6}" y="{y + 3:.1f}" text-anchor="end" {_SVG_FONT} '
+                    f'font-size="10" fill="{COLORS["dark"]}">{tick:g}</text>')
+        tick += step
+
+    slot = plot_w / len(labels)
+    bar_w = slot * 0.8
+    for i, (label, count, color) in enumerate(zip(labels, counts, colors)):
+        x = left + i * slot + (slot - bar_w) / 2
+        cx = x + bar_w / 2
+        bar_h = count * scale
+        body.append(f'<rect x="{x:.1f}" y="{base_y - bar_h:.1f}" width="{bar_w:.1f}" '
+                    f'height="{bar_h:.1f}" fill="{color}" fill-opacity="0.8"/>')
+        body.append(f'<text x="{cx:.1f}" y="{base_y - bar_h - 4:.1f}" text-anchor="middle" '
+                    f'{_SVG_FONT} font-size="10" fill="{COLORS["dark"]}">{count}</text>')
+        if rotate:
+            body.append(f'<text x="{cx:.1f}" y="{base_y + 14:.1f}" text-anchor="end" '
+                        f'transform="rotate(-45 {cx:.1f} {base_y + 14:.1f})" {_SVG_FONT} '
+                        f'font-size="10" fill="{COLORS["dark"]}">{escape(label)}</text>')
+        else:
+            body.append(f'<text x="{cx:.1f}" y="{base_y + 16:.1f}" text-anchor="middle" '
+                        f'{_SVG_FONT} font-size="10" fill="{COLORS["dark"]}">{escape(label)}</text>')
+
+    # Left and bottom spines, axis labels
+    body.append(f'<line x1="{left}" y1="{top}" x2="{left}" y2="{base_y:.1f}" stroke="{COLORS["gray"]}"/>')
+    body.append(f'<line x1="{left}" y1="{base_y:.1f}" x2="{left + plot_w:.1f}" y2="{base_y:.1f}" '
+                f'stroke="{COLORS["gray"]}"/>')
+    body.append(f'<text x="{left + plot_w / 2:.1f}" y="{height - 12:.1f}" text-anchor="middle" '
+                f'{_SVG_FONT} font-size="12" fill="{COLORS["dark"]}">{escape(xlabel)}</text>')
+    body.append(f'<text x="18" y="{top + plot_h / 2:.1f}" text-anchor="middle" '
+                f'transform="rotate(-90 18 {top + plot_h / 2:.1f})" {_SVG_FONT} font-size="12" '
+                f'fill="{COLORS["dark"]}">{escape(ylabel)}</text>')
+    return _svg_document(width, height, title, body)
+
+
+def _render_donut_svg(labels: Sequence[str], counts: Sequence[int], colors: Sequence[str],
+                      size: Tuple[float, float], title: str = 'Status Distribution') -> bytes:
+    """Donut chart as an SVG document, starting at 12 o'clock and running counter-clockwise."""
+    width, height = size
+    cx, cy = width / 2, 50 + (height - 50) / 2
+    outer = min(width, height - 50) * 0.38
+    inner = outer * 0.6
+    total = sum(counts)
+
+    def point(angle: float, radius: float) -> Tuple[float, float]:
+        # SVG y grows downwards, so counter-clockwise means subtracting the sine
+        return cx + radius * math.cos(angle), cy - radius * math.sin(angle)
+
+    body = []
+    start = math.pi / 2
+    for label, count, color in zip(labels, counts, colors):
+        sweep = 2 * math.pi * count / total
+        end = start + sweep
+        if count == total:
+            # A single full-circle arc is degenerate in SVG, draw the ring as a thick stroke
+            body.append(f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{(outer + inner) / 2:.1f}" fill="none" '
+                        f'stroke="{color}" stroke-width="{outer - inner:.1f}"/>')
+        else:
+            large = 1 if sweep > math.pi else 0
+            (ox1, oy1), (ox2, oy2) = point(start, outer), point(end, outer)
+            (ix1, iy1), (ix2, iy2) = point(end, inner), point(start, inner)
+            body.append(f'<path d="M {ox1:.2f} {oy1:.2f} A {outer:.2f} {outer:.2f} 0 {large} 0 {ox2:.2f} {oy2:.2f} '
+                        f'L {ix1:.2f} {iy1:.2f} A {inner:.2f} {inner:.2f} 0 {large} 1 {ix2:.2f} {iy2:.2f} Z" '
+                        f'fill="{color}" stroke="white"/>')
+
+        mid = start + sweep / 2
+        px, py = point(mid, outer * 0.8)
+        body.append(f'<text x="{px:.1f}" y="{py + 3:.1f}" text-anchor="middle" {_SVG_FONT} '
+                    f'font-size="9" font-weight="bold" fill="white">{100 * count / total:.1f}%</text>')
+        lx, ly = point(mid, outer * 1.1)
+        anchor = 'start' if math.cos(mid) > 0.01 else 'end' if math.cos(mid) < -0.01 else 'middle'
+        body.append(f'<text x="{lx:.1f}" y="{ly + 4:.1f}" text-anchor="{anchor}" {_SVG_FONT} '
+                    f'font-size="10" fill="{COLORS["dark"]}">{escape(label)}</text>')
+        start = end
+    return _svg_document(width, height, title, body)
 
 
 class ChartGenerator:
     """Generate charts for PDF export matching frontend styling."""
     
-    def __init__(self, dpi: int = 300, figsize: tuple = (10, 6)):
+    def __init__(self, dpi: int = 150, figsize: tuple = (10, 6)):
         """
         Initialize chart generator.
         
@@ -60,164 +557,73 @@ class ChartGenerator:
         self.dpi = dpi
         self.figsize = figsize
         
-    def generate_category_chart(self, assets: List[Asset]) -> BytesIO:
+    def generate_category_chart(self, session: Session, criteria: Sequence[Any] = ()) -> BytesIO:
         """
         Generate bar chart showing asset count by category.
         Matches frontend AssetChart component.
-        """
-        # Group data by category
-        category_counts = Counter()
-        for asset in assets:
-            category = (asset.category or 'Unknown').title()
-            category_counts[category] += 1
-        
-        if not category_counts:
-            return self._generate_empty_chart("No category data available")
-        
-        # Prepare data for plotting
-        categories = list(category_counts.keys())
-        counts = list(category_counts.values())
-        
-        # Create chart
-        fig, ax = plt.subplots(figsize=self.figsize)
-        
-        bars = ax.bar(categories, counts, color=COLORS['primary'], alpha=0.8)
-        
-        # Styling to match frontend
-        ax.set_title('Assets by Category', fontsize=16, fontweight='bold', 
-                    color=COLORS['dark'], pad=20)
-        ax.set_xlabel('Category', fontsize=12, color=COLORS['dark'])
-        ax.set_ylabel('Asset Count', fontsize=12, color=COLORS['dark'])
-        
-        # Grid styling
-        ax.grid(True, linestyle='--', alpha=0.3, color=COLORS['gray'])
-        ax.set_axisbelow(True)
         
-        # Rotate x-axis labels if too many categories
-        if len(categories) > 5:
-            plt.xticks(rotation=45, ha='right')
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                   f'{int(height)}', ha='center', va='bottom', fontsize=10)
-        
-        # Remove top and right spines
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color(COLORS['gray'])
-        ax.spines['bottom'].set_color(COLORS['gray'])
-        
-        plt.tight_layout()
-        
-        return self._save_chart_to_buffer(fig)
+        Args:
+            session: Database session used for the aggregate query
+            criteria: Optional SQL criteria restricting the assets counted
+        """
+        return self._render(*_aggregate('category', session, criteria))
+    
+    def _plot_category(self, category_counts: Dict[str, int]) -> BytesIO:
+        """Draw the category bar chart from aggregated counts as SVG."""
+        svg = _render_bar_svg(
+            list(category_counts.keys()),
+            list(category_counts.values()),
+            [COLORS['primary']] * len(category_counts),
+            self._svg_size()
+        )
+        return BytesIO(svg)
     
-    def generate_status_pie_chart(self, assets: List[Asset]) -> BytesIO:
+    def generate_status_pie_chart(self, session: Session, criteria: Sequence[Any] = ()) -> BytesIO:
         """
         Generate pie chart showing status distribution.
         Matches frontend StatusPieChart component.
-        """
-        # Filter to match dashboard (Active, Stock, Pending Rebuild only)
-        filtered_assets = [a for a in assets if a.status in ['Active', 'Stock', 'Pending Rebuild']]
-        
-        # Group data by status
-        status_counts = Counter()
-        for asset in filtered_assets:
-            status = (asset.status or 'Unknown').lower()
-            status_counts[status] += 1
+        Only Active, Stock and Pending Rebuild assets are counted, to match the dashboard.
         
-        if not status_counts:
-            return self._generate_empty_chart("No status data available")
-        
-        # Prepare data
+        Args:
+            session: Database session used for the aggregate query
+            criteria: Optional SQL criteria restricting the assets counted
+        """
+        return self._render(*_aggregate('status', session, criteria))
+    
+    def _plot_status(self, status_counts: Dict[str, int]) -> BytesIO:
+        """Draw the status donut chart from aggregated counts as SVG."""
         statuses = list(status_counts.keys())
-        counts = list(status_counts.values())
-        colors = [STATUS_COLORS.get(status, COLORS['gray']) for status in statuses]
-        
-        # Create chart
-        fig, ax = plt.subplots(figsize=self.figsize)
-        
-        # Create pie chart with donut style (matches frontend)
-        pie_parts = ax.pie(
-            counts, 
-            labels=[s.title() for s in statuses],
-            colors=colors,
-            autopct='%1.1f%%',
-            startangle=90,
-            pctdistance=0.85,  # Move percentage labels outward
-            wedgeprops=dict(width=0.4)  # Create donut hole
+        svg = _render_donut_svg(
+            [s.title() for s in statuses],
+            list(status_counts.values()),
+            list(map(_STATUS_COLORS_LOWER.get, statuses, repeat(COLORS['gray']))),
+            self._svg_size()
         )
-        _, texts, autotexts = pie_parts  # type: ignore
-        
-        # Styling
-        ax.set_title('Status Distribution', fontsize=16, fontweight='bold', 
-                    color=COLORS['dark'], pad=20)
-        
-        # Style the text
-        for text in texts:
-            text.set_fontsize(10)
-            text.set_color(COLORS['dark'])
-        
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(9)
-        
-        plt.tight_layout()
-        
-        return self._save_chart_to_buffer(fig)
+        return BytesIO(svg)
     
-    def generate_trends_chart(self, assets: List[Asset]) -> BytesIO:
+    def generate_trends_chart(self, session: Session, criteria: Sequence[Any] = ()) -> BytesIO:
         """
         Generate area chart showing monthly asset trends by status.
         Matches frontend TrendChart component.
-        """
-        # Filter to match dashboard (Active, Stock, Pending Rebuild only)
-        filtered_assets = [a for a in assets if a.status in ['Active', 'Stock', 'Pending Rebuild']]
-        
-        # Group assets by month and status
-        monthly_data = defaultdict(lambda: {'active': 0, 'pending': 0, 'stock': 0})
-        
-        for asset in filtered_assets:
-            if not asset.created_at:
-                continue
-                
-            try:
-                # Parse the created_at date
-                if isinstance(asset.created_at, str):
-                    created_date = datetime.fromisoformat(asset.created_at.replace('Z', '+00:00'))
-                else:
-                    created_date = asset.created_at
-                
-                month_key = created_date.strftime('%Y-%m')
-                month_label = created_date.strftime('%b %Y')
-                
-                # Categorize status
-                status = (asset.status or '').lower()
-                if 'active' in status:
-                    monthly_data[month_key]['active'] += 1
-                elif 'pending' in status and 'rebuild' in status:
-                    monthly_data[month_key]['pending'] += 1
-                elif 'stock' in status:
-                    monthly_data[month_key]['stock'] += 1
-                    
-            except (ValueError, AttributeError):
-                continue
+        Only Active, Stock and Pending Rebuild assets are counted, to match the dashboard.
         
-        if not monthly_data:
-            return self._generate_empty_chart("No trend data available")
-        
-        # Sort by month and prepare data
-        sorted_months = sorted(monthly_data.keys())
-        months = [datetime.strptime(m, '%Y-%m').strftime('%b %Y') for m in sorted_months]
+        Args:
+            session: Database session used for the aggregate query
+            criteria: Optional SQL criteria restricting the assets counted
+        """
+        return self._render(*_aggregate('trends', session, criteria))
+    
+    def _plot_trends(self, monthly_data: Dict[datetime, Dict[str, int]]) -> BytesIO:
+        """Plot the stacked monthly trends chart from aggregated counts."""
+        # Months arrive already sorted from the query
+        months = [m.strftime('%b %Y') for m in monthly_data]
         
-        active_counts = [monthly_data[m]['active'] for m in sorted_months]
-        pending_counts = [monthly_data[m]['pending'] for m in sorted_months]
-        stock_counts = [monthly_data[m]['stock'] for m in sorted_months]
+        active_counts = [series['active'] for series in monthly_data.values()]
+        pending_counts = [series['pending'] for series in monthly_data.values()]
+        stock_counts = [series['stock'] for series in monthly_data.values()]
         
         # Create chart
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._new_axes(self.figsize)
         
         # Create stacked area chart
         ax.fill_between(range(len(months)), stock_counts, 
@@ -256,96 +662,41 @@ class ChartGenerator:
         # Legend
         ax.legend(loc='upper left', frameon=False)
         
-        plt.tight_layout()
-        
         return self._save_chart_to_buffer(fig)
     
-    def generate_warranty_expiration_chart(self, assets: List[Asset]) -> BytesIO:
+    def generate_warranty_expiration_chart(self, session: Session, criteria: Sequence[Any] = ()) -> BytesIO:
         """
         Generate bar chart showing warranty expiration trends.
         Matches frontend LaptopExpirationChart component.
         Only includes Apple laptops and specific Lenovo models: X13 Gen1, Gen2, Gen4.
-        """
-        # Filter for specific laptop models only
-        laptop_assets = []
-        for asset in assets:
-            if not asset.category or 'laptop' not in asset.category.lower():
-                continue
-            if not asset.warranty_expires:
-                continue
-                
-            manufacturer = (asset.manufacturer or '').lower()
-            model = (asset.model or '').lower()
-            
-            # Include Apple laptops
-            if 'apple' in manufacturer:
-                laptop_assets.append(asset)
-            # Include only specific Lenovo models
-            elif 'lenovo' in manufacturer and ('x13' in model):
-                if any(gen in model for gen in ['gen1', 'gen 1', 'gen2', 'gen 2', 'gen4', 'gen 4']):
-                    laptop_assets.append(asset)
-        
-        # Group by quarter and model
-        quarterly_data = defaultdict(lambda: defaultdict(int))
-        
-        for asset in laptop_assets:
-            try:
-                # Parse warranty expiration date
-                if isinstance(asset.warranty_expires, str):
-                    exp_date = datetime.strptime(asset.warranty_expires, '%Y-%m-%d').date()
-                else:
-                    exp_date = asset.warranty_expires
-                
-                # Get quarter
-                quarter = f"Q{((exp_date.month - 1) // 3) + 1} {exp_date.year}"
-                
-                # Get model key
-                manufacturer = (asset.manufacturer or '').lower()
-                model = (asset.model or '').lower()
-                
-                if 'apple' in manufacturer:
-                    # Group Apple laptops by chip generation
-                    if 'm4' in model:
-                        model_key = 'Apple M4'
-                    elif 'm3' in model:
-                        model_key = 'Apple M3'
-                    elif 'm2' in model:
-                        model_key = 'Apple M2'
-                    elif 'm1' in model:
-                        model_key = 'Apple M1'
-                    else:
-                        model_key = 'Apple Other'
-                elif 'lenovo' in manufacturer and 'x13' in model:
-                    # Identify specific X13 generation
-                    if 'gen1' in model or 'gen 1' in model:
-                        model_key = 'Lenovo X13 Gen1'
-                    elif 'gen2' in model or 'gen 2' in model:
-                        model_key = 'Lenovo X13 Gen2'
-                    elif 'gen4' in model or 'gen 4' in model:
-                        model_key = 'Lenovo X13 Gen4'
-                    else:
-                        model_key = f"Lenovo X13"
-                else:
-                    model_key = asset.model or 'Unknown'
-                
-                quarterly_data[quarter][model_key] += 1
-                
-            except (ValueError, AttributeError):
-                continue
-        
-        if not quarterly_data:
-            return self._generate_empty_chart("No warranty expiration data available")
         
+        Args:
+            session: Database session used for the aggregate query
+            criteria: Optional SQL criteria restricting the assets counted
+        """
+        return self._render(*_aggregate('warranty', session, criteria))
+    
+    def _plot_warranty(self, quarterly_data: Dict[Tuple[int, int], Dict[str, int]]) -> BytesIO:
+        """Plot the grouped warranty expiration chart from aggregated counts."""
         # Prepare data for plotting
-        quarters = sorted(quarterly_data.keys(), 
-                         key=lambda q: (int(q.split()[1]), int(q[1])))
-        all_models = set()
-        for quarter_data in quarterly_data.values():
-            all_models.update(quarter_data.keys())
-        all_models = sorted(all_models)
+        # (year, quarter) keys sort chronologically as plain tuples
+        quarters = sorted(quarterly_data)
+        all_models = sorted({model for quarter_data in quarterly_data.values() for model in quarter_data})
+        
+        # Dense (quarter, model) count matrix; column i is model i's bar series
+        quarter_index = {quarter: i for i, quarter in enumerate(quarters)}
+        model_index = {model: i for i, model in enumerate(all_models)}
+        cells = [
+            (quarter_index[quarter], model_index[model], count)
+            for quarter, quarter_data in quarterly_data.items()
+            for model, count in quarter_data.items()
+        ]
+        matrix = np.zeros((len(quarters), len(all_models)), dtype=np.int32)
+        q_idx, m_idx, values = zip(*cells)
+        np.add.at(matrix, (q_idx, m_idx), values)
         
         # Create chart
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._new_axes((12, 6))
         
         # Generate distinctly different colors for specific models
         model_colors = {
@@ -373,13 +724,12 @@ class ChartGenerator:
                 fallback_index += 1
         
         # Create grouped bar chart
-        x = range(len(quarters))
+        x = np.arange(len(quarters))
         bar_width = 0.15
         
         for i, model in enumerate(all_models):
-            values = [quarterly_data[q].get(model, 0) for q in quarters]
             offset = (i - len(all_models)/2 + 0.5) * bar_width
-            bars = ax.bar([xi + offset for xi in x], values, bar_width, 
+            bars = ax.bar(x + offset, matrix[:, i], bar_width, 
                          label=model, color=model_colors[model], alpha=0.8)
             
             # Add value labels on bars
@@ -397,12 +747,13 @@ class ChartGenerator:
         
         # X-axis labels - reduce density for readability
         ax.set_xticks(x)
+        quarter_labels = [f"Q{quarter} {year}" for year, quarter in quarters]
         if len(quarters) > 4:
             # Show every other quarter if more than 4 quarters
-            labels = [quarters[i] if i % 2 == 0 else '' for i in range(len(quarters))]
+            labels = [quarter_labels[i] if i % 2 == 0 else '' for i in range(len(quarters))]
             ax.set_xticklabels(labels, rotation=45, ha='right')
         else:
-            ax.set_xticklabels(quarters, rotation=45, ha='right')
+            ax.set_xticklabels(quarter_labels, rotation=45, ha='right')
         
         # Grid and styling
         ax.grid(True, linestyle='--', alpha=0.3, color=COLORS['gray'])
@@ -414,13 +765,11 @@ class ChartGenerator:
         if all_models:
             ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', frameon=False)
         
-        plt.tight_layout()
-        
         return self._save_chart_to_buffer(fig)
     
-    def _generate_empty_chart(self, message: str) -> BytesIO:
+    def _plot_empty(self, message: str) -> BytesIO:
         """Generate a simple chart with a message for empty data."""
-        fig, ax = plt.subplots(figsize=self.figsize)
+        fig, ax = self._new_axes(self.figsize)
         
         ax.text(0.5, 0.5, message, ha='center', va='center', 
                fontsize=14, color=COLORS['gray'], 
@@ -432,18 +781,77 @@ class ChartGenerator:
         
         return self._save_chart_to_buffer(fig)
     
+    def _new_axes(self, figsize: tuple):
+        """Get this thread's reusable Figure for `figsize` with a fresh Axes on it."""
+        fig = _get_reusable_fig(figsize)
+        return fig, fig.add_subplot()
+    
+    def generate_all(self, session: Session, chart_types: Sequence[str],
+                     criteria: Sequence[Any] = ()) -> Dict[str, bytes]:
+        """
+        Generate several charts at once, returning image bytes per chart type
+        (SVG for the SVG_KINDS charts, PNG otherwise).
+        Aggregates run on the given session; PNG charts not already cached are
+        rendered concurrently in the render process pool.
+        Unknown chart types are skipped.
+        """
+        pngs: Dict[str, bytes] = {}
+        pending = {}
+        for chart_type in chart_types:
+            if chart_type not in _CHART_AGGREGATES:
+                continue
+            kind, data = _aggregate(chart_type, session, criteria)
+            if kind in SVG_KINDS:
+                # Plain string formatting, cheaper inline than a pool round trip
+                pngs[chart_type] = getattr(self, f'_plot_{kind}')(data).getvalue()
+                continue
+            key = self._cache_key(kind, data)
+            png = _PNG_CACHE.get(key)
+            if png is not None:
+                pngs[chart_type] = png
+            else:
+                future = _get_render_pool().submit(_render_png, kind, data, self.dpi, self.figsize)
+                pending[chart_type] = (key, future)
+        
+        for chart_type, (key, future) in pending.items():
+            png = future.result()
+            _PNG_CACHE.put(key, png)
+            pngs[chart_type] = png
+        
+        # Preserve the requested chart order
+        return {chart_type: pngs[chart_type] for chart_type in chart_types if chart_type in pngs}
+    
+    def _cache_key(self, kind: str, data: Any) -> tuple:
+        """PNG cache key for a chart: the render code version, its aggregated input and render settings."""
+        return (_RENDER_VERSION, matplotlib.__version__, kind, _freeze(data), self.dpi, tuple(self.figsize))
+    
+    def _svg_size(self) -> Tuple[float, float]:
+        """SVG canvas size in points for the configured figsize."""
+        return self.figsize[0] * 72, self.figsize[1] * 72
+    
+    def _render(self, kind: str, data: Any) -> BytesIO:
+        """
+        Render a chart from its aggregated data via the matching _plot_* method.
+        Identical PNG input at the same dpi/figsize is served from the PNG cache.
+        """
+        if kind in SVG_KINDS:
+            return getattr(self, f'_plot_{kind}')(data)
+        key = self._cache_key(kind, data)
+        png = _PNG_CACHE.get(key)
+        if png is None:
+            png = getattr(self, f'_plot_{kind}')(data).getvalue()
+            _PNG_CACHE.put(key, png)
+        return BytesIO(png)
+    
     def _save_chart_to_buffer(self, fig) -> BytesIO:
         """Save matplotlib figure to BytesIO buffer."""
         buffer = BytesIO()
         try:
-            fig.savefig(buffer, format='png', dpi=self.dpi, 
-                       bbox_inches='tight', facecolor='white', 
-                       edgecolor='none', pad_inches=0.2)
+            fig.savefig(buffer, format='png', dpi=self.dpi,
+                       facecolor='white', edgecolor='none',
+                       pil_kwargs={'compress_level': 1})
             buffer.seek(0)
         finally:
-            plt.close(fig)  # Always free memory
-            plt.clf()       # Clear the current figure
-            # Force garbage collection for matplotlib objects
-            import gc
-            gc.collect()
+            # Drop the plotted artists; the Figure itself is reused
+            fig.clear()
         return buffer 
\ No newline at end of file
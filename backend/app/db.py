@@ -1,15 +1,24 @@
+from functools import lru_cache
+
+from sqlalchemy.engine import Engine
 from sqlmodel import create_engine, Session
 from .settings import settings
 
-# Main database engine
-engine = create_engine(
-    settings.database_url,
-    echo=False,
-    pool_pre_ping=True,
-)
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Main database engine, created on first use so importing the app opens no pool."""
+    return create_engine(
+        settings.database_url,
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,  # Drop connections before idle TCP timeouts
+        pool_use_lifo=True,  # Reuse the most recent connections so idle ones can expire
+        query_cache_size=settings.db_query_cache_size,
+    )
 
 def get_session():
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
-
-        
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Buffered ExportHistory writes. Exports record their history row here and
+return without a database round-trip; a background thread inserts the
+buffered rows in batches with one multi-row INSERT.
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from .db import get_engine
+from .models import ExportHistory
+
+logger = logging.getLogger(__name__)
+
+# Buffered rows are written at least this often (seconds)...
+_FLUSH_INTERVAL = 2.0
+# ...or as soon as this many are waiting
+_MAX_BATCH = 100
+
+
+class ExportHistoryWriter:
+    """Collects ExportHistory rows and writes them from a daemon thread."""
+
+    def __init__(self, flush_interval: float = _FLUSH_INTERVAL, max_batch: int = _MAX_BATCH):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        # Bumped after every write, so read caches can key on it
+        self.version = 0
+        self._rows: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        # Held from taking the buffered rows until they are committed, so a flush()
+        # returns only once every row recorded before it is in the database
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, history: ExportHistory) -> None:
+        """Queue a history row; starts the writer thread on first use."""
+        row = history.model_dump(exclude={"id"})
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.max_batch
+            if self._thread is None:
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, name="export-history-writer", daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """
+        Write every buffered row now, waiting for a batch already being written.
+        Failures are logged, never raised to the export.
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return
+            try:
+                with Session(get_engine()) as session:
+                    session.execute(insert(ExportHistory), rows)
+                    session.commit()
+                self.version += 1
+            except Exception as e:
+                logger.exception("Failed to save export history", extra={'error': str(e), 'rows': len(rows)})
+
+    def stop(self) -> None:
+        """Stop the writer thread, writing whatever is still buffered."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+# Global writer instance
+export_history_writer = ExportHistoryWriter()
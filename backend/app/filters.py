@@ -0,0 +1,41 @@
+"""
+Table filter helpers shared by the export and chart code paths.
+Translates the dashboard TableFilters into SQL criteria for Asset queries.
+"""
+from typing import List, Optional, Any
+
+from sqlalchemy import func, or_
+
+from .models import Asset, TableFilters
+
+
+def _contains(column, value: str):
+    """Case-insensitive substring match, same semantics as `value.lower() in column.lower()`."""
+    return func.lower(column).contains(value.lower(), autoescape=True)
+
+
+def table_filter_criteria(filters: Optional[TableFilters]) -> List[Any]:
+    """Build the WHERE criteria for the given table filters (empty list for no filters)."""
+    if not filters:
+        return []
+
+    criteria = []
+    if filters.company:
+        criteria.append(_contains(Asset.company, filters.company))
+    if filters.manufacturer:
+        criteria.append(_contains(Asset.manufacturer, filters.manufacturer))
+    if filters.category:
+        criteria.append(_contains(Asset.category, filters.category))
+    if filters.model:
+        criteria.append(_contains(Asset.model, filters.model))
+    if filters.department:
+        criteria.append(_contains(Asset.department, filters.department))
+    if filters.searchQuery:
+        criteria.append(or_(
+            _contains(Asset.asset_name, filters.searchQuery),
+            _contains(Asset.asset_tag, filters.searchQuery),
+            _contains(Asset.serial, filters.searchQuery),
+            _contains(Asset.location, filters.searchQuery),
+        ))
+    return criteria
+
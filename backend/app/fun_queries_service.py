@@ -1,269 +1,396 @@
 """
 Fun Queries Service - handles predefined asset queries
 """
-from typing import List, Dict, Any
+import threading
+from time import monotonic
+from typing import List, Dict, Any, Optional, Tuple
 from sqlmodel import Session, select, func
-from datetime import date, timedelta
+from sqlalchemy import bindparam, case, literal_column, union_all, update
+from datetime import date, datetime, time, timedelta
 from collections import defaultdict  # type: ignore
 
-from .models import Asset
+from .models import Asset, DataVersion
+
+# Seconds a template's result is served from the in-process cache
+_CACHE_TTL = 30.0
+
+# Columns returned by the asset-list queries (row keys are the column names)
+_ASSET_COLS = (
+    Asset.id, Asset.asset_name, Asset.asset_tag, Asset.category, Asset.manufacturer,
+    Asset.model, Asset.serial, Asset.status, Asset.company, Asset.location,
+    Asset.warranty_expires, Asset.created_at,
+)
+
+_EMPTY = literal_column("''")
+
+_SHARED_VERSION_STMT = select(DataVersion.version).where(DataVersion.id == 1)
+_BUMP_SHARED_VERSION_STMT = (
+    update(DataVersion).where(DataVersion.id == 1).values(version=DataVersion.version + 1)
+)
+
+
+def _is_blank(column):
+    """
+    coalesce(column, '') = '' with the literal inlined, so the planner can match
+    the ix_asset_missing_* partial indexes (a bound parameter would hide it).
+    """
+    return func.coalesce(column, _EMPTY) == _EMPTY
+
+
+# WHERE clause for each data-quality template
+_MISSING_PREDICATES = {
+    "missing_serial": _is_blank(Asset.serial),
+    "missing_asset_tag": _is_blank(Asset.asset_tag),
+    "missing_warranty": Asset.warranty_expires.is_(None),  # type: ignore
+    "missing_manufacturer": _is_blank(Asset.manufacturer),
+    "missing_location": _is_blank(Asset.location),
+}
+
+# Columns with a "<column>_breakdown" template
+_BREAKDOWN_COLUMNS = ("status", "manufacturer", "category", "company")
+
+
+def _all_breakdowns_statement():
+    """
+    Asset counts per value for every breakdown column in one UNION ALL, as
+    (dim, bucket, count) rows ordered by dim and then largest group first.
+    NULL and empty values are merged into a single "Unknown" bucket in SQL.
+    """
+    members = []
+    for dim in _BREAKDOWN_COLUMNS:
+        bucket = func.coalesce(func.nullif(getattr(Asset, dim), ""), "Unknown")
+        members.append(
+            # Inline literal: an untyped bound parameter in a UNION can't be typed by Postgres
+            select(literal_column(f"'{dim}'").label("dim"), bucket.label("bucket"),
+                   func.count().label("count"))
+            .group_by(bucket)
+        )
+    combined = union_all(*members).subquery()
+    return select(combined.c.dim, combined.c.bucket, combined.c.count).order_by(
+        combined.c.dim, combined.c.count.desc()
+    )
+
+
+# Statements are built once at import and only the date parameters are bound per
+# call, so every execution after the first reuses the compiled SQL.
+_EXPIRED_STMT = select(*_ASSET_COLS).where(Asset.warranty_expires < bindparam("today"))  # type: ignore
+# One 0-90 day scan serves all three expiring_* templates
+_EXPIRING_WINDOWS = (30, 60, 90)
+_EXPIRING_BUNDLE_STMT = select(*_ASSET_COLS).where(
+    Asset.warranty_expires.between(bindparam("today"), bindparam("cutoff"))  # type: ignore
+).order_by(Asset.warranty_expires)  # type: ignore
+_RECENT_STMT = select(*_ASSET_COLS).where(Asset.created_at >= bindparam("since"))  # type: ignore
+_MISSING_STMTS = {
+    template_id: select(*_ASSET_COLS).where(predicate)
+    for template_id, predicate in _MISSING_PREDICATES.items()
+}
+_ALL_BREAKDOWNS_STMT = _all_breakdowns_statement()
+_DATA_QUALITY_SUMMARY_STMT = select(*[
+    func.sum(case((predicate, 1), else_=0)).label(template_id)
+    for template_id, predicate in _MISSING_PREDICATES.items()
+]).select_from(Asset)
+
+
+# Query templates shown in the UI, by category
+_TEMPLATES: Dict[str, Any] = {
+    "warranty_analysis": {
+        "title": "Warranty Analysis",
+        "description": "Analyze warranty status and expiration dates",
+        "queries": {
+            "expired_warranties": {
+                "name": "Assets with Expired Warranties",
+                "description": "Assets whose warranty has already expired"
+            },
+            "expiring_30_days": {
+                "name": "Expiring in 30 Days",
+                "description": "Assets with warranty expiring in the next 30 days"
+            },
+            "expiring_60_days": {
+                "name": "Expiring in 60 Days",
+                "description": "Assets with warranty expiring in the next 60 days"
+            },
+            "expiring_90_days": {
+                "name": "Expiring in 90 Days",
+                "description": "Assets with warranty expiring in the next 90 days"
+            },
+            "no_warranty_info": {
+                "name": "No Warranty Information",
+                "description": "Assets with missing warranty expiration dates"
+            }
+        }
+    },
+    "data_quality": {
+        "title": "Data Quality Checks",
+        "description": "Identify assets with missing or incomplete information",
+        "queries": {
+            "missing_serial": {
+                "name": "Missing Serial Numbers",
+                "description": "Assets without serial numbers"
+            },
+            "missing_asset_tag": {
+                "name": "Missing Asset Tags",
+                "description": "Assets without asset tags"
+            },
+            "missing_warranty": {
+                "name": "Missing Warranty Dates",
+                "description": "Assets without warranty expiration dates"
+            },
+            "missing_manufacturer": {
+                "name": "Missing Manufacturer",
+                "description": "Assets without manufacturer information"
+            },
+            "missing_location": {
+                "name": "Missing Location",
+                "description": "Assets without location information"
+            }
+        }
+    },
+    "asset_insights": {
+        "title": "Asset Insights",
+        "description": "Analyze asset distribution and patterns",
+        "queries": {
+            "status_breakdown": {
+                "name": "Assets by Status",
+                "description": "Count of assets grouped by status"
+            },
+            "manufacturer_breakdown": {
+                "name": "Assets by Manufacturer",
+                "description": "Count of assets grouped by manufacturer"
+            },
+            "category_breakdown": {
+                "name": "Assets by Category",
+                "description": "Count of assets grouped by category"
+            },
+            "recent_assets": {
+                "name": "Recently Added Assets",
+                "description": "Assets added in the last 30 days"
+            },
+            "company_breakdown": {
+                "name": "Assets by Company",
+                "description": "Count of assets grouped by company"
+            }
+        }
+    }
+}
+
+# template_id -> display name
+_TEMPLATE_NAMES = {
+    template_id: query["name"]
+    for category in _TEMPLATES.values()
+    for template_id, query in category["queries"].items()
+}
 
 
 class FunQueriesService:
     """Service to handle predefined asset queries."""
     
+    # Results shared by all requests in this process:
+    # template_id -> (computed_at, shared version, rows). The queries are parameterless
+    # reads, so the template id and the data version they were computed at are the key.
+    _cache: Dict[str, Tuple[float, int, List[Dict[str, Any]]]] = {}
+    _cache_lock = threading.Lock()
+    
     def __init__(self, session: Session):
         self.session = session
+        # Results already returned by this instance (one request), checked before the TTL cache
+        self._request_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._shared_version: Optional[int] = None
+    
+    @classmethod
+    def invalidate(cls, session: Session) -> None:
+        """
+        Record an asset data change: drops this process's cached results and bumps
+        the shared data version in `session`'s transaction, so call it before the commit.
+        """
+        if not session.exec(_BUMP_SHARED_VERSION_STMT).rowcount:  # type: ignore
+            session.add(DataVersion(id=1, version=1))
+        with cls._cache_lock:
+            cls._cache.clear()
+    
+    def shared_version(self) -> int:
+        """The data version stored in the database, common to every worker; read once per request."""
+        if self._shared_version is None:
+            self._shared_version = self.session.exec(_SHARED_VERSION_STMT).first() or 0
+        return self._shared_version
+    
+    def etag(self, key: str) -> str:
+        """
+        Weak ETag for a query result. Changes whenever the data does, in whichever
+        worker, and at midnight since the warranty and recent-asset windows are date based.
+        """
+        return f'W/"{self.shared_version()}-{date.today().isoformat()}-{key}"'
     
     @staticmethod
     def get_templates() -> Dict[str, Any]:
         """Get all available query templates organized by category."""
-        return {
-            "warranty_analysis": {
-                "title": "Warranty Analysis",
-                "description": "Analyze warranty status and expiration dates",
-                "queries": {
-                    "expired_warranties": {
-                        "name": "Assets with Expired Warranties",
-                        "description": "Assets whose warranty has already expired"
-                    },
-                    "expiring_30_days": {
-                        "name": "Expiring in 30 Days",
-                        "description": "Assets with warranty expiring in the next 30 days"
-                    },
-                    "expiring_60_days": {
-                        "name": "Expiring in 60 Days",
-                        "description": "Assets with warranty expiring in the next 60 days"
-                    },
-                    "expiring_90_days": {
-                        "name": "Expiring in 90 Days",
-                        "description": "Assets with warranty expiring in the next 90 days"
-                    },
-                    "no_warranty_info": {
-                        "name": "No Warranty Information",
-                        "description": "Assets with missing warranty expiration dates"
-                    }
-                }
-            },
-            "data_quality": {
-                "title": "Data Quality Checks",
-                "description": "Identify assets with missing or incomplete information",
-                "queries": {
-                    "missing_serial": {
-                        "name": "Missing Serial Numbers",
-                        "description": "Assets without serial numbers"
-                    },
-                    "missing_asset_tag": {
-                        "name": "Missing Asset Tags",
-                        "description": "Assets without asset tags"
-                    },
-                    "missing_warranty": {
-                        "name": "Missing Warranty Dates",
-                        "description": "Assets without warranty expiration dates"
-                    },
-                    "missing_manufacturer": {
-                        "name": "Missing Manufacturer",
-                        "description": "Assets without manufacturer information"
-                    },
-                    "missing_location": {
-                        "name": "Missing Location",
-                        "description": "Assets without location information"
-                    }
-                }
-            },
-            "asset_insights": {
-                "title": "Asset Insights",
-                "description": "Analyze asset distribution and patterns",
-                "queries": {
-                    "status_breakdown": {
-                        "name": "Assets by Status",
-                        "description": "Count of assets grouped by status"
-                    },
-                    "manufacturer_breakdown": {
-                        "name": "Assets by Manufacturer",
-                        "description": "Count of assets grouped by manufacturer"
-                    },
-                    "category_breakdown": {
-                        "name": "Assets by Category",
-                        "description": "Count of assets grouped by category"
-                    },
-                    "recent_assets": {
-                        "name": "Recently Added Assets",
-                        "description": "Assets added in the last 30 days"
-                    },
-                    "company_breakdown": {
-                        "name": "Assets by Company",
-                        "description": "Count of assets grouped by company"
-                    }
-                }
-            }
-        }
+        return _TEMPLATES
     
     def get_template_name(self, template_id: str) -> str:
         """Get the display name for a template."""
-        templates = self.get_templates()
-        for category in templates.values():
-            if template_id in category["queries"]:
-                return category["queries"][template_id]["name"]
-        return "Unknown Query"
+        return _TEMPLATE_NAMES.get(template_id, "Unknown Query")
     
     def execute_query(self, template_id: str) -> List[Dict[str, Any]]:
         """Execute a predefined query template."""
-        query_map = {
-            # Warranty Analysis
-            "expired_warranties": self._get_expired_warranties,
-            "expiring_30_days": lambda: self._get_expiring_warranties(30),
-            "expiring_60_days": lambda: self._get_expiring_warranties(60),
-            "expiring_90_days": lambda: self._get_expiring_warranties(90),
-            "no_warranty_info": self._get_no_warranty_info,
-            
-            # Data Quality
-            "missing_serial": self._get_missing_serial,
-            "missing_asset_tag": self._get_missing_asset_tag,
-            "missing_warranty": self._get_missing_warranty,
-            "missing_manufacturer": self._get_missing_manufacturer,
-            "missing_location": self._get_missing_location,
-            
-            # Asset Insights
-            "status_breakdown": self._get_status_breakdown,
-            "manufacturer_breakdown": self._get_manufacturer_breakdown,
-            "category_breakdown": self._get_category_breakdown,
-            "recent_assets": self._get_recent_assets,
-            "company_breakdown": self._get_company_breakdown,
-        }
-        
-        if template_id not in query_map:
+        try:
+            query, args = self._QUERY_MAP[template_id]
+        except KeyError:
             raise ValueError(f"Unknown query template: {template_id}")
         
-        return query_map[template_id]()
+        result = self._request_cache.get(template_id)
+        if result is not None:
+            return result
+        
+        now = monotonic()
+        version = self.shared_version()
+        cached = self._cache.get(template_id)
+        if cached is not None and cached[1] == version and now - cached[0] < _CACHE_TTL:
+            result = cached[2]
+        else:
+            result = query(self, *args)
+            with self._cache_lock:
+                self._cache[template_id] = (now, version, result)
+        self._request_cache[template_id] = result
+        return result
+    
+    def get_data_quality_summary(self) -> Dict[str, int]:
+        """Count the assets failing each data-quality check, all in one table scan."""
+        row = self.session.exec(_DATA_QUALITY_SUMMARY_STMT).one()
+        # SUM over an empty table is NULL
+        return {template_id: count or 0 for template_id, count in zip(_MISSING_PREDICATES, row)}
     
     # Warranty Analysis Queries
     def _get_expired_warranties(self) -> List[Dict[str, Any]]:
         """Get assets with expired warranties."""
-        today = date.today()
-        statement = select(Asset).where(
-            Asset.warranty_expires.is_not(None),  # type: ignore
-            Asset.warranty_expires < today  # type: ignore
-        )
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        # NULLs never satisfy the range, so no IS NOT NULL check is needed
+        return self._asset_rows(_EXPIRED_STMT, today=date.today())
     
-    def _get_expiring_warranties(self, days: int) -> List[Dict[str, Any]]:
-        """Get assets with warranties expiring in the next X days."""
+    def get_warranty_expiring_bundle(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Assets expiring within 30, 60 and 90 days from a single range scan,
+        sorted by expiry date. Windows are cumulative like the templates, so
+        "60" also contains the "30" rows.
+        """
         today = date.today()
-        future_date = today + timedelta(days=days)
-        statement = select(Asset).where(
-            Asset.warranty_expires.is_not(None),  # type: ignore
-            Asset.warranty_expires >= today,  # type: ignore
-            Asset.warranty_expires <= future_date  # type: ignore
+        rows = self._asset_rows(
+            _EXPIRING_BUNDLE_STMT, today=today, cutoff=today + timedelta(days=_EXPIRING_WINDOWS[-1])
         )
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        bundle: Dict[str, List[Dict[str, Any]]] = {str(days): [] for days in _EXPIRING_WINDOWS}
+        for row in rows:
+            remaining = (row["warranty_expires"] - today).days
+            for days in _EXPIRING_WINDOWS:
+                if remaining <= days:
+                    bundle[str(days)].append(row)
+        return bundle
+    
+    def _expiring(self, days: int) -> List[Dict[str, Any]]:
+        """
+        One expiring_* window. The tabs are usually opened in order, so the
+        neighbouring windows are cached from the same scan and load instantly.
+        """
+        bundle = self.get_warranty_expiring_bundle()
+        now = monotonic()
+        version = self.shared_version()
+        with self._cache_lock:
+            for window, rows in bundle.items():
+                self._cache[f"expiring_{window}_days"] = (now, version, rows)
+        return bundle[str(days)]
     
     def _get_no_warranty_info(self) -> List[Dict[str, Any]]:
         """Get assets with no warranty information."""
-        statement = select(Asset).where(Asset.warranty_expires.is_(None))  # type: ignore
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        return self._asset_rows(_MISSING_STMTS["missing_warranty"])
     
     # Data Quality Queries
     def _get_missing_serial(self) -> List[Dict[str, Any]]:
         """Get assets missing serial numbers."""
-        statement = select(Asset).where(
-            (Asset.serial.is_(None)) | (Asset.serial == "")  # type: ignore
-        )
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        return self._asset_rows(_MISSING_STMTS["missing_serial"])
     
     def _get_missing_asset_tag(self) -> List[Dict[str, Any]]:
         """Get assets missing asset tags."""
-        statement = select(Asset).where(
-            (Asset.asset_tag.is_(None)) | (Asset.asset_tag == "")  # type: ignore
-        )
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        return self._asset_rows(_MISSING_STMTS["missing_asset_tag"])
     
     def _get_missing_warranty(self) -> List[Dict[str, Any]]:
         """Get assets missing warranty dates."""
-        statement = select(Asset).where(Asset.warranty_expires.is_(None))  # type: ignore
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        return self._asset_rows(_MISSING_STMTS["missing_warranty"])
     
     def _get_missing_manufacturer(self) -> List[Dict[str, Any]]:
         """Get assets missing manufacturer information."""
-        statement = select(Asset).where(
-            (Asset.manufacturer.is_(None)) | (Asset.manufacturer == "")  # type: ignore
-        )
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        return self._asset_rows(_MISSING_STMTS["missing_manufacturer"])
     
     def _get_missing_location(self) -> List[Dict[str, Any]]:
         """Get assets missing location information."""
-        statement = select(Asset).where(
-            (Asset.location.is_(None)) | (Asset.location == "")  # type: ignore
-        )
-        assets = self.session.exec(statement).all()
-        return [self._asset_to_dict(asset) for asset in assets]
+        return self._asset_rows(_MISSING_STMTS["missing_location"])
     
     # Asset Insights Queries
     def _get_status_breakdown(self) -> List[Dict[str, Any]]:
         """Get count of assets by status."""
-        statement = select(Asset.status, func.count(Asset.id).label("count")).group_by(Asset.status)  # type: ignore
-        results = self.session.exec(statement).all()
-        return [{"status": row[0] or "Unknown", "count": row[1]} for row in results]
+        return self._breakdown("status")
     
     def _get_manufacturer_breakdown(self) -> List[Dict[str, Any]]:
         """Get count of assets by manufacturer."""
-        statement = select(Asset.manufacturer, func.count(Asset.id).label("count")).group_by(Asset.manufacturer)  # type: ignore
-        results = self.session.exec(statement).all()
-        return [{"manufacturer": row[0] or "Unknown", "count": row[1]} for row in results]
+        return self._breakdown("manufacturer")
     
     def _get_category_breakdown(self) -> List[Dict[str, Any]]:
         """Get count of assets by category."""
-        statement = select(Asset.category, func.count(Asset.id).label("count")).group_by(Asset.category)  # type: ignore
-        results = self.session.exec(statement).all()
-        return [{"category": row[0] or "Unknown", "count": row[1]} for row in results]
+        return self._breakdown("category")
     
     def _get_recent_assets(self) -> List[Dict[str, Any]]:
         """Get assets added in the last 30 days."""
-        thirty_days_ago = date.today() - timedelta(days=30)
-        # Note: created_at is stored as string, so we need to handle this carefully
-        statement = select(Asset).where(Asset.created_at.is_not(None))  # type: ignore
-        assets = self.session.exec(statement).all()
-        
-        # Filter in Python since created_at is a string
-        recent_assets = []
-        for asset in assets:
-            if asset.created_at:
-                try:
-                    # Parse the created_at string (assuming ISO format)
-                    created_date = date.fromisoformat(asset.created_at.split('T')[0])
-                    if created_date >= thirty_days_ago:
-                        recent_assets.append(asset)
-                except (ValueError, AttributeError):
-                    continue
-        
-        return [self._asset_to_dict(asset) for asset in recent_assets]
+        since = datetime.combine(date.today() - timedelta(days=30), time.min)
+        return self._asset_rows(_RECENT_STMT, since=since)
     
     def _get_company_breakdown(self) -> List[Dict[str, Any]]:
         """Get count of assets by company."""
-        statement = select(Asset.company, func.count(Asset.id).label("count")).group_by(Asset.company)  # type: ignore
-        results = self.session.exec(statement).all()
-        return [{"company": row[0] or "Unknown", "count": row[1]} for row in results]
+        return self._breakdown("company")
+    
+    def get_all_breakdowns(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Counts per value for every breakdown column, fetched in a single round trip."""
+        breakdowns: Dict[str, List[Dict[str, Any]]] = {dim: [] for dim in _BREAKDOWN_COLUMNS}
+        for dim, bucket, total in self.session.exec(_ALL_BREAKDOWNS_STMT):
+            breakdowns[dim].append({dim: bucket, "count": total})
+        return breakdowns
+    
+    def _breakdown(self, label: str) -> List[Dict[str, Any]]:
+        """
+        Breakdown for one column. All four come back from the same query, so
+        the other three are cached too and their templates skip the database.
+        """
+        breakdowns = self.get_all_breakdowns()
+        now = monotonic()
+        version = self.shared_version()
+        with self._cache_lock:
+            for dim, rows in breakdowns.items():
+                self._cache[f"{dim}_breakdown"] = (now, version, rows)
+        return breakdowns[label]
     
-    def _asset_to_dict(self, asset: Asset) -> Dict[str, Any]:
-        """Convert Asset model to dictionary for API response."""
-        return {
-            "id": asset.id,
-            "asset_name": asset.asset_name,
-            "asset_tag": asset.asset_tag,
-            "category": asset.category,
-            "manufacturer": asset.manufacturer,
-            "model": asset.model,
-            "serial": asset.serial,
-            "status": asset.status,
-            "company": asset.company,
-            "location": asset.location,
-            "warranty_expires": asset.warranty_expires.isoformat() if asset.warranty_expires else None,  # type: ignore
-            "created_at": asset.created_at
-        }
\ No newline at end of file
+    def _asset_rows(self, statement, **params: Any) -> List[Dict[str, Any]]:
+        """
+        Run a prebuilt _ASSET_COLS query with the given bound parameters.
+        Dates are left as date/datetime objects; the endpoint's orjson
+        response serializes them to ISO strings natively.
+        """
+        # The rows are kept as a list for the result cache, so they are fetched in one go
+        return [row._asdict() for row in self.session.exec(statement, params=params)]
+    
+    # template_id -> (query method, args), built once with the class rather than per call
+    _QUERY_MAP = {
+        # Warranty Analysis
+        "expired_warranties": (_get_expired_warranties, ()),
+        "expiring_30_days": (_expiring, (30,)),
+        "expiring_60_days": (_expiring, (60,)),
+        "expiring_90_days": (_expiring, (90,)),
+        "no_warranty_info": (_get_no_warranty_info, ()),
+        
+        # Data Quality
+        "missing_serial": (_get_missing_serial, ()),
+        "missing_asset_tag": (_get_missing_asset_tag, ()),
+        "missing_warranty": (_get_missing_warranty, ()),
+        "missing_manufacturer": (_get_missing_manufacturer, ()),
+        "missing_location": (_get_missing_location, ()),
+        
+        # Asset Insights
+        "status_breakdown": (_get_status_breakdown, ()),
+        "manufacturer_breakdown": (_get_manufacturer_breakdown, ()),
+        "category_breakdown": (_get_category_breakdown, ()),
+        "recent_assets": (_get_recent_assets, ()),
+        "company_breakdown": (_get_company_breakdown, ()),
+    }
@@ -1,28 +1,62 @@
 from fastapi import FastAPI
 import logging
 from contextlib import asynccontextmanager
+from sqlalchemy import inspect
 from sqlmodel import SQLModel
-from .db import engine
-from .models import Asset, User
+from .db import get_engine
 from .routers.assets import router as assets_router
 from app.routers.sync import router as sync_router
 from .routers.fun_queries import router as fun_queries_router
 from .routers.users import router as users_router
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from .scheduler import sync_scheduler
+from .export_history import export_history_writer
+from .chart_generator import shutdown_render_pool
 
 
 
+def create_missing_tables():
+    """
+    Create only the tables that don't exist yet. One table listing replaces the
+    per-table existence checks of create_all, and nothing runs once the schema
+    is in place.
+    """
+    from . import models  # noqa: F401  (registers the tables on SQLModel.metadata)
+
+    with get_engine().begin() as conn:
+        existing = set(inspect(conn).get_table_names())
+        missing = [table for name, table in SQLModel.metadata.tables.items() if name not in existing]
+        if missing:
+            SQLModel.metadata.create_all(conn, tables=missing)
+
+
+class SelectiveGZipMiddleware:
+    """GZipMiddleware for every response except those on `exclude_paths`."""
+
+    def __init__(self, app, exclude_paths=(), **gzip_options):
+        self.app = app
+        self.gzip = GZipMiddleware(app, **gzip_options)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     # Create tables in the main database (includes assets and users)
-    SQLModel.metadata.create_all(engine)
+    create_missing_tables()
     sync_scheduler.start()
     yield
     # Shutdown
     sync_scheduler.stop()
+    export_history_writer.stop()
+    shutdown_render_pool()
 
 app = FastAPI(
     title="Asset Management API",
@@ -45,6 +79,14 @@ app.include_router(sync_router)
 app.include_router(fun_queries_router)
 app.include_router(users_router)
 
+# Compress JSON and PDF responses; an xlsx is already a zip archive
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    exclude_paths=("/assets/export-excel",),
+    minimum_size=1024,
+    compresslevel=6,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
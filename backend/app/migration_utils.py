@@ -0,0 +1,98 @@
+"""
+Helpers shared by the Alembic migrations.
+
+Schema changes to one table should go through add_columns() (or a single
+op.batch_alter_table block) rather than separate op.add_column() calls, so the
+table's ACCESS EXCLUSIVE lock is taken once per release instead of once per column.
+"""
+from typing import Optional, Set
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import Column
+from sqlalchemy.engine import Inspector
+from sqlalchemy.schema import CreateColumn
+
+
+def column_names(inspector: Inspector, table_name: str) -> Set[str]:
+    """Column names of an existing table (empty set if the table doesn't exist)."""
+    if not inspector.has_table(table_name):
+        return set()
+    return {col['name'] for col in inspector.get_columns(table_name)}
+
+
+def add_columns(inspector: Inspector, table_name: str, *columns: Column) -> None:
+    """Add the missing columns to a table with a single multi-clause ALTER TABLE."""
+    existing = column_names(inspector, table_name)
+    missing = [col for col in columns if col.name not in existing]
+    if not missing:
+        return
+
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        with op.batch_alter_table(table_name) as batch_op:
+            for col in missing:
+                batch_op.add_column(col)
+        return
+
+    clauses = ', '.join(
+        f"ADD COLUMN {CreateColumn(col).compile(dialect=bind.dialect)}" for col in missing
+    )
+    op.execute(f"ALTER TABLE {bind.dialect.identifier_preparer.quote(table_name)} {clauses}")
+
+
+def backfill_in_batches(
+    table_name: str,
+    set_clause: str,
+    batch_size: int = 10_000,
+    where: Optional[str] = None,
+) -> None:
+    """
+    Run `UPDATE table SET <set_clause> [AND <where>]` in primary-key ranges of
+    `batch_size`, committing each batch so no long-lived lock is held on the table.
+    """
+    condition = "id BETWEEN :start AND :end" + (f" AND {where}" if where else "")
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        min_id, max_id = bind.execute(sa.text(f"SELECT min(id), max(id) FROM {table_name}")).one()
+        if min_id is None:
+            return
+        for start in range(min_id, max_id + 1, batch_size):
+            bind.execute(
+                sa.text(f"UPDATE {table_name} SET {set_clause} WHERE {condition}"),
+                {'start': start, 'end': start + batch_size - 1},
+            )
+
+
+def convert_column_in_batches(
+    table_name: str,
+    column_name: str,
+    new_type: sa.types.TypeEngine,
+    using: str,
+    batch_size: int = 10_000,
+) -> None:
+    """
+    Change a column's type through a `<column>_new` copy instead of ALTER ... TYPE
+    USING, which rewrites the whole table under an ACCESS EXCLUSIVE lock.
+
+    The copy is added and backfilled outside the revision's transaction, so a
+    failed swap can simply be re-run: the add is idempotent and the backfill
+    skips rows already copied. The swap runs in the revision's transaction with
+    writes blocked, after re-copying every row whose copy no longer matches its
+    source, so rows inserted or updated since their batch ran aren't lost.
+    """
+    bind = op.get_bind()
+    new_column = f"{column_name}_new"
+    table = bind.dialect.identifier_preparer.quote(table_name)
+    op.execute(
+        f"ALTER TABLE {table} "
+        f"ADD COLUMN IF NOT EXISTS {new_column} {new_type.compile(dialect=bind.dialect)}"
+    )
+    backfill_in_batches(table_name, f"{new_column} = {using}", batch_size, where=f"{new_column} IS NULL")
+
+    # Readers carry on until the DROP; writers wait from here
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    op.execute(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(f"UPDATE {table} SET {new_column} = {using} WHERE {new_column} IS DISTINCT FROM ({using})")
+    op.drop_column(table_name, column_name)
+    op.alter_column(table_name, new_column, new_column_name=column_name)
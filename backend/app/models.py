@@ -1,7 +1,7 @@
 from typing import Optional
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, String
-from datetime import date
+from sqlalchemy import Column, String, DateTime, Index, text
+from datetime import date, datetime
 from pydantic import BaseModel
 from typing import List
 
@@ -19,7 +19,7 @@ class AssetCreate(BaseModel):
     department: Optional[str] = None
     assigned_user_name: Optional[str] = None
     status: Optional[str] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
     company: Optional[str] = None
 
 class AssetUpdate(BaseModel):
@@ -36,12 +36,27 @@ class AssetUpdate(BaseModel):
     department: Optional[str] = None
     assigned_user_name: Optional[str] = None
     status: Optional[str] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
     company: Optional[str] = None
 
 
 
+# Text columns checked by the "missing ..." data-quality queries
+MISSING_CHECK_COLUMNS = ("serial", "asset_tag", "manufacturer", "location")
+
+
 class Asset(SQLModel, table=True):
+    # Partial indexes covering only the rows each data-quality check returns
+    __table_args__ = tuple(
+        Index(
+            f"ix_asset_missing_{column}",
+            "id",
+            postgresql_where=text(f"coalesce({column}, '') = ''"),
+            sqlite_where=text(f"coalesce({column}, '') = ''"),
+        )
+        for column in MISSING_CHECK_COLUMNS
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # plain, snake-case attributes  ↓↓↓   ⇢ become lowercase SQL columns
@@ -58,12 +73,12 @@ class Asset(SQLModel, table=True):
     manufacturer: str | None = Field(default=None, nullable=True)
     serial: str | None = Field(default=None, nullable=True)
     warranty: str | None = Field(default=None, nullable=True)
-    warranty_expires: date | None = Field(default=None, nullable=True)
+    warranty_expires: date | None = Field(default=None, nullable=True, index=True)
     location: str | None = Field(default=None, nullable=True)
     department: str | None = Field(default=None, nullable=True)
     assigned_user_name: str | None = Field(default=None, nullable=True)
     status: str | None = Field(default=None, nullable=True)
-    created_at: str | None = Field(default=None, nullable=True)
+    created_at: datetime | None = Field(default=None, sa_column=Column(DateTime, index=True))
     # these were added for Snipe IT API data - careful renaming!
 
 
@@ -93,6 +108,14 @@ class ExportHistory(SQLModel, table=True):
     status: str = Field(default="completed")  # pending, completed, failed
 
 
+class DataVersion(SQLModel, table=True):
+    """Single-row counter bumped with every asset data change, shared by all workers."""
+    __tablename__ = "data_version"  # type: ignore
+
+    id: int = Field(default=1, primary_key=True)
+    version: int = Field(default=0)
+
+
 # Pydantic models for API requests/responses (not database tables)
 
 class TableFilters(BaseModel):
@@ -138,3 +161,15 @@ class ExportResponse(BaseModel):
     message: str
     file_size_bytes: Optional[int] = None
     export_id: Optional[int] = None
+
+
+class AssetPage(BaseModel):
+    """One page of assets from keyset pagination."""
+    items: List[Asset]
+    next: Optional[int] = None  # pass as `after` for the next page; None on the last page
+
+
+class UserPage(BaseModel):
+    """One page of users from keyset pagination."""
+    items: List[User]
+    next: Optional[int] = None  # pass as `after` for the next page; None on the last page
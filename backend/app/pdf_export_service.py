@@ -3,12 +3,22 @@ PDF Export Service for generating professional asset management reports.
 Uses ReportLab for PDF generation and integrates with ChartGenerator.
 """
 
-import json
 from io import BytesIO
+import hashlib
 import logging
+import threading
+import time
 from datetime import datetime, date
-from typing import List, Dict, Any, Optional
-from collections import Counter
+from typing import BinaryIO, Iterable, List, Dict, Any, Optional
+from tempfile import SpooledTemporaryFile
+from collections import Counter, OrderedDict
+from operator import attrgetter
+
+from reportlab import rl_config
+
+# Skip per-attribute validation on graphics shapes (the SVG chart drawings).
+# Read when reportlab.graphics.shapes is first imported, so it must come first.
+rl_config.shapeChecking = 0
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4, landscape, portrait
@@ -16,31 +26,231 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-    PageBreak, Image, KeepTogether
+    Image, KeepTogether
 )
 from reportlab.platypus.flowables import HRFlowable
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.graphics.shapes import Drawing
+from svglib.svglib import svg2rlg
+from PIL import Image as PILImage
+from sqlmodel import Session
 
 from .models import Asset, ExportConfig, TableFilters, ExportHistory
 from .chart_generator import ChartGenerator
+from .filters import table_filter_criteria
+
+# Bytes of PDF output kept in memory before generate_pdf spills to a temp file
+_SPOOL_MAX_SIZE = 2 * 1024 * 1024
+
+# Resolution PNG charts are resampled to for embedding, per point of drawn size
+_PNG_PIXELS_PER_POINT = 2
+
+# Recently generated PDFs are reused for identical exports (same config and
+# same filtered assets) for this long, so the "Generated on" time stays recent
+_PDF_CACHE_TTL = 300.0
+# PDFs larger than the in-memory spool limit are not cached
+_PDF_CACHE_MAX_BYTES = _SPOOL_MAX_SIZE
+
+# Asset fields that feed the report's summary and charts
+_FINGERPRINT_FIELDS = attrgetter(
+    'id', 'status', 'category', 'manufacturer', 'model', 'created_at', 'warranty_expires'
+)
+
+# The asset table shows at most this many rows
+_TABLE_MAX_ROWS = 100
+
+
+class _PDFCache:
+    """Small thread-safe LRU of generated PDF bytes whose entries expire after a TTL."""
+    
+    def __init__(self, maxsize: int = 32, ttl: float = _PDF_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: bytes) -> Optional[bytes]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            stored_at, pdf = entry
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return pdf
+    
+    def put(self, key: bytes, pdf: bytes) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic(), pdf)
+            self._items.move_to_end(key)
+            if len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+
+_PDF_CACHE = _PDFCache()
+
+# Table styles are built once and shared; setStyle only reads them
+_SUMMARY_TABLE_STYLE = TableStyle([
+    # Label rows (even indices)
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#374151')),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f9fafb')),
+    ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#f9fafb')),
+    # Value rows (odd indices)
+    ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+    ('FONTNAME', (0, 3), (-1, 3), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 1), (-1, 1), 18),
+    ('FONTSIZE', (0, 3), (-1, 3), 18),
+    ('TEXTCOLOR', (0, 1), (-1, 1), colors.HexColor('#3b82f6')),
+    ('TEXTCOLOR', (0, 3), (-1, 3), colors.HexColor('#3b82f6')),
+    # General styling
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+_ASSET_TABLE_STYLE = TableStyle([
+    # Header styling
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#374151')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    
+    # Data styling
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#4b5563')),
+    
+    # General styling
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    
+    # Alternate row colors
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [None, colors.HexColor('#fafafa')]),
+])
+
+# Section title for each chart type in the report
+CHART_TITLES = {
+    'category': "Assets by Category",
+    'status': "Status Distribution",
+    'trends': "Monthly Asset Trends",
+    'warranty': "Warranty Expiration Trends",
+}
+
+
+def _downscale_png(png: BytesIO, draw_width: float, draw_height: float) -> BytesIO:
+    """
+    Shrink a chart PNG to _PNG_PIXELS_PER_POINT pixels per point of its drawn
+    size (~144 DPI) before embedding. Charts with few enough colors are stored
+    as palette images.
+    """
+    png.seek(0)
+    with PILImage.open(png) as pil:
+        pil = pil.convert('RGB')
+    pil.thumbnail(
+        (int(draw_width * _PNG_PIXELS_PER_POINT), int(draw_height * _PNG_PIXELS_PER_POINT)),
+        # Area averaging: no ringing around text and lines, so it compresses best
+        PILImage.BOX
+    )
+    colors_used = pil.getcolors(256)
+    if colors_used:
+        pil = pil.convert('P', palette=PILImage.ADAPTIVE, colors=len(colors_used))
+    out = BytesIO()
+    pil.save(out, format='PNG', optimize=True)
+    out.seek(0)
+    return out
+
+
+def _build_styles() -> Dict[str, ParagraphStyle]:
+    """Set up custom paragraph styles for the PDF."""
+    styles = getSampleStyleSheet()
+    
+    custom_styles = {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Title'],
+            fontSize=24,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#1f2937')
+        ),
+        'heading1': ParagraphStyle(
+            'CustomHeading1',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=20,
+            spaceBefore=30,
+            textColor=colors.HexColor('#1f2937')
+        ),
+        'heading2': ParagraphStyle(
+            'CustomHeading2',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceAfter=15,
+            spaceBefore=20,
+            textColor=colors.HexColor('#374151')
+        ),
+        'normal': ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=10,
+            spaceAfter=6,
+            textColor=colors.HexColor('#4b5563')
+        ),
+        'small': ParagraphStyle(
+            'CustomSmall',
+            parent=styles['Normal'],
+            fontSize=8,
+            spaceAfter=4,
+            textColor=colors.HexColor('#6b7280')
+        ),
+        'footer': ParagraphStyle(
+            'CustomFooter',
+            parent=styles['Normal'],
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=colors.HexColor('#9ca3af')
+        )
+    }
+    
+    return custom_styles
+
+
+# Built once per process and shared by every export; the styles are only read
+_STYLES = _build_styles()
 
 
 class PDFExportService:
     """Service for generating PDF exports of asset management data."""
     
-    def __init__(self, assets: List[Asset], config: ExportConfig):
+    def __init__(self, assets: Iterable[Asset], config: ExportConfig, session: Session):
         """
         Initialize PDF export service.
         
         Args:
-            assets: List of Asset objects to include in export
+            assets: Asset objects to include in export, read once; a streaming
+                query result works without holding every row in memory
             config: Export configuration specifying what to include
+            session: Database session used for chart aggregate queries
         """
-        self.assets = assets
         self.config = config
+        self.session = session
+        # SQL equivalent of the table filters applied to `assets`
+        self.criteria = table_filter_criteria(config.tableFilters)
         self.chart_generator = ChartGenerator()
-        self.styles = self._setup_styles()
+        self.styles = _STYLES
         self.logger = logging.getLogger(__name__)
+        self._scan_assets(assets)
         # Margins in points (72 pt = 1 inch)
         self.left_margin = 72
         self.right_margin = 72
@@ -68,18 +278,33 @@ class PDFExportService:
                 'orientation': config.orientation,
                 'computed_page_width': page_w,
                 'computed_page_height': page_h,
-                'asset_count': len(self.assets)
+                'asset_count': self.asset_count
             }
         )
     
-    def generate_pdf(self) -> BytesIO:
+    def generate_pdf(self, out: Optional[BinaryIO] = None) -> BinaryIO:
         """
         Generate PDF document based on configuration.
         
+        Args:
+            out: Writable binary stream to build the PDF into. Defaults to a
+                spooled temporary file that moves to disk past 2 MB, so large
+                reports don't have to sit in memory in full.
+        
         Returns:
-            BytesIO buffer containing the PDF document
+            The stream containing the PDF document, rewound to the start
         """
-        buffer = BytesIO()
+        buffer = out if out is not None else SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+        
+        # Identical export generated recently: reuse its bytes
+        cache_key = self._cache_key()
+        self.etag = f'"{cache_key.hex()}"'
+        cached = _PDF_CACHE.get(cache_key)
+        if cached is not None:
+            buffer.write(cached)
+            buffer.seek(0)
+            return buffer
+        start = buffer.tell()
         
         # Create document
         doc = SimpleDocTemplate(
@@ -131,76 +356,56 @@ class PDFExportService:
             )
             doc.build(story)
         except Exception:
-            # Log full stack trace with configuration for troubleshooting
-            try:
-                config_json = json.dumps(self.config.model_dump())
-            except Exception:
-                config_json = "<unserializable>"
-            self.logger.exception(
-                "Failed to build PDF document",
-                extra={
-                    'export_config': config_json,
-                    'asset_count': len(self.assets)
-                }
-            )
+            # Log full stack trace with configuration for troubleshooting;
+            # the config is only serialized if the record will be emitted
+            if self.logger.isEnabledFor(logging.ERROR):
+                try:
+                    config_json = self.config.model_dump_json(exclude_none=True)
+                except Exception:
+                    config_json = "<unserializable>"
+                self.logger.exception(
+                    "Failed to build PDF document",
+                    extra={
+                        'export_config': config_json,
+                        'asset_count': self.asset_count
+                    }
+                )
             raise
+        
+        if buffer.tell() - start <= _PDF_CACHE_MAX_BYTES:
+            buffer.seek(start)
+            _PDF_CACHE.put(cache_key, buffer.read())
         buffer.seek(0)
         
         return buffer
     
-    def _setup_styles(self) -> Dict[str, ParagraphStyle]:
-        """Set up custom paragraph styles for the PDF."""
-        styles = getSampleStyleSheet()
-        
-        custom_styles = {
-            'title': ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Title'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor('#1f2937')
-            ),
-            'heading1': ParagraphStyle(
-                'CustomHeading1',
-                parent=styles['Heading1'],
-                fontSize=18,
-                spaceAfter=20,
-                spaceBefore=30,
-                textColor=colors.HexColor('#1f2937')
-            ),
-            'heading2': ParagraphStyle(
-                'CustomHeading2',
-                parent=styles['Heading2'],
-                fontSize=14,
-                spaceAfter=15,
-                spaceBefore=20,
-                textColor=colors.HexColor('#374151')
-            ),
-            'normal': ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontSize=10,
-                spaceAfter=6,
-                textColor=colors.HexColor('#4b5563')
-            ),
-            'small': ParagraphStyle(
-                'CustomSmall',
-                parent=styles['Normal'],
-                fontSize=8,
-                spaceAfter=4,
-                textColor=colors.HexColor('#6b7280')
-            ),
-            'footer': ParagraphStyle(
-                'CustomFooter',
-                parent=styles['Normal'],
-                fontSize=8,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor('#9ca3af')
-            )
-        }
-        
-        return custom_styles
+    def _scan_assets(self, assets: Iterable[Asset]) -> None:
+        """
+        Single pass over the assets, keeping only what the report uses: the
+        count, status counts, a fingerprint for the cache key and the rows
+        the asset table can show.
+        """
+        fingerprint = hashlib.blake2b(digest_size=16)
+        status_counts = Counter()
+        table_assets = []
+        count = 0
+        for count, asset in enumerate(assets, start=1):
+            # Read from the instance __dict__ to skip SQLAlchemy's attribute descriptor
+            values = asset.__dict__
+            status_counts[values['status'] if 'status' in values else asset.status] += 1
+            fingerprint.update(repr(_FINGERPRINT_FIELDS(asset)).encode())
+            if count <= _TABLE_MAX_ROWS:
+                table_assets.append(asset)
+        self.asset_count = count
+        self._status_counts = status_counts
+        self._assets_fingerprint = fingerprint.digest()
+        self._table_assets = table_assets
+    
+    def _cache_key(self) -> bytes:
+        """Digest of the export config and the assets' report-relevant fields."""
+        digest = hashlib.blake2b(self.config.model_dump_json().encode(), digest_size=16)
+        digest.update(self._assets_fingerprint)
+        return digest.digest()
     
     def _build_header(self) -> List:
         """Build the header section of the PDF."""
@@ -219,7 +424,7 @@ class PDFExportService:
         # Report metadata
         metadata_data = [
             ['Generated on:', datetime.now().strftime('%B %d, %Y at %I:%M %p')],
-            ['Total Assets:', str(len(self.assets))],
+            ['Total Assets:', str(self.asset_count)],
             ['Page Size:', self.config.pageSize],
             ['Orientation:', self.config.orientation.title()]
         ]
@@ -330,27 +535,7 @@ class PDFExportService:
             
             col_width = (6 * inch) / cols
             summary_table = Table(table_data, colWidths=[col_width] * cols)
-            summary_table.setStyle(TableStyle([
-                # Label rows (even indices)
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 11),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#374151')),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f9fafb')),
-                ('BACKGROUND', (0, 2), (-1, 2), colors.HexColor('#f9fafb')),
-                # Value rows (odd indices)
-                ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 3), (-1, 3), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 1), (-1, 1), 18),
-                ('FONTSIZE', (0, 3), (-1, 3), 18),
-                ('TEXTCOLOR', (0, 1), (-1, 1), colors.HexColor('#3b82f6')),
-                ('TEXTCOLOR', (0, 3), (-1, 3), colors.HexColor('#3b82f6')),
-                # General styling
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e5e7eb')),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ]))
+            summary_table.setStyle(_SUMMARY_TABLE_STYLE)
             
             story.append(KeepTogether([summary_table]))
         
@@ -361,44 +546,24 @@ class PDFExportService:
         """Build the charts section with selected charts."""
         story = []
         
-        # Ensure charts start on a fresh page to avoid layout issues when
-        # the remaining space on the current page is insufficient (e.g. landscape).
-        # Only break if there is already content in the story to avoid blank page at start.
         section_header = Paragraph("Charts and Analytics", self.styles['heading1'])
         
-        for i, chart_type in enumerate(self.config.selectedCharts):
-            chart_block: List = []
-            
-            # Build chart content
-            if chart_type == 'category':
-                chart_block = self._add_chart(
-                    "Assets by Category",
-                    self.chart_generator.generate_category_chart(self.assets)
-                )
-            elif chart_type == 'status':
-                chart_block = self._add_chart(
-                    "Status Distribution",
-                    self.chart_generator.generate_status_pie_chart(self.assets)
-                )
-            elif chart_type == 'trends':
-                chart_block = self._add_chart(
-                    "Monthly Asset Trends",
-                    self.chart_generator.generate_trends_chart(self.assets)
-                )
-            elif chart_type == 'warranty':
-                chart_block = self._add_chart(
-                    "Warranty Expiration Trends",
-                    self.chart_generator.generate_warranty_expiration_chart(self.assets)
-                )
+        # Aggregate every selected chart up front and render them in parallel
+        charts = self.chart_generator.generate_all(
+            self.session, self.config.selectedCharts, self.criteria
+        )
+        
+        for i, (chart_type, image) in enumerate(charts.items()):
+            chart_block = self._add_chart(CHART_TITLES[chart_type], BytesIO(image))
             
             # Layout policy:
             # - First chart: keep the section header and the chart together
             #   so the header never sits alone on a page.
-            # - Subsequent charts: start on a new page and keep each chart block together.
+            # - Every chart block is kept together and flows after the previous
+            #   one; KeepTogether moves it to a new page only if it doesn't fit.
             if i == 0:
                 story.append(KeepTogether([section_header] + chart_block))
             else:
-                story.append(PageBreak())
                 story.append(KeepTogether(chart_block))
             
             # Spacing after each chart block
@@ -414,9 +579,14 @@ class PDFExportService:
         story.append(Paragraph(title, self.styles['heading2']))
         story.append(Spacer(1, 12))
         
-        # Chart image
+        # Chart image (SVG charts are embedded as vector drawings)
         try:
-            img = Image(chart_buffer)
+            if chart_buffer.getvalue().startswith(b'<svg'):
+                img = svg2rlg(chart_buffer)
+                intrinsic_width, intrinsic_height = float(img.width), float(img.height)
+            else:
+                img = Image(chart_buffer)
+                intrinsic_width, intrinsic_height = float(img.imageWidth), float(img.imageHeight)
             # Compute available space based on page size and margins
             page_width, page_height = self.page_size
             max_width = max(page_width - (self.left_margin + self.right_margin), 1)
@@ -424,14 +594,21 @@ class PDFExportService:
             reserved_above = 1.25 * inch
             max_height = max(page_height - (self.top_margin + self.bottom_margin) - reserved_above, 1)
 
-            intrinsic_width = float(img.imageWidth)
-            intrinsic_height = float(img.imageHeight)
             scale_w = max_width / intrinsic_width
             scale_h = max_height / intrinsic_height
             scale = min(scale_w, scale_h, 1.0)
 
-            img.drawWidth = intrinsic_width * scale
-            img.drawHeight = intrinsic_height * scale
+            if isinstance(img, Drawing):
+                img.scale(scale, scale)
+                img.width = intrinsic_width * scale
+                img.height = intrinsic_height * scale
+                draw_width, draw_height = img.width, img.height
+            else:
+                draw_width, draw_height = intrinsic_width * scale, intrinsic_height * scale
+                img = Image(
+                    _downscale_png(chart_buffer, draw_width, draw_height),
+                    width=draw_width, height=draw_height
+                )
 
             # Log sizing for troubleshooting layout errors
             self.logger.info(
@@ -443,8 +620,8 @@ class PDFExportService:
                     'max_height': max_height,
                     'intrinsic_width': intrinsic_width,
                     'intrinsic_height': intrinsic_height,
-                    'draw_width': img.drawWidth,
-                    'draw_height': img.drawHeight,
+                    'draw_width': draw_width,
+                    'draw_height': draw_height,
                 }
             )
 
@@ -464,67 +641,44 @@ class PDFExportService:
         
         story.append(Paragraph("Asset Details", self.styles['heading1']))
         
-        # Filter assets if table filters are specified
-        filtered_assets = self._apply_table_filters()
-        
-        if not filtered_assets:
+        # The caller has already applied the table filters while loading the assets
+        if not self.asset_count:
             story.append(Paragraph("No assets match the specified criteria.", self.styles['normal']))
             return story
         
         # Limit to first 100 assets for PDF readability
-        display_assets = filtered_assets[:100]
-        if len(filtered_assets) > 100:
-            truncate_msg = f"Showing first 100 of {len(filtered_assets)} assets."
+        display_assets = self._table_assets
+        if self.asset_count > _TABLE_MAX_ROWS:
+            truncate_msg = f"Showing first {_TABLE_MAX_ROWS} of {self.asset_count} assets."
             story.append(Paragraph(truncate_msg, self.styles['small']))
             story.append(Spacer(1, 10))
         
         # Build table data
-        headers = [col.replace('_', ' ').title() for col in self.config.tableColumns]
+        columns = self.config.tableColumns
+        headers = [col.replace('_', ' ').title() for col in columns]
         table_data = [headers]
         
-        for asset in display_assets:
-            row = []
-            for col in self.config.tableColumns:
-                value = getattr(asset, col, '') or ''
-                # Truncate long values
-                if len(str(value)) > 30:
-                    value = str(value)[:27] + '...'
-                row.append(str(value))
-            table_data.append(row)
-        
-        # Create table
-        col_width = (7 * inch) / len(self.config.tableColumns)
-        asset_table = Table(table_data, colWidths=[col_width] * len(self.config.tableColumns))
-        
-        # Style table
-        table_style = [
-            # Header styling
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f3f4f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#374151')),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            
-            # Data styling
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#4b5563')),
-            
-            # General styling
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ]
+        # attrgetter reads all of a row's columns in one call; columns that
+        # aren't Asset fields fall back to getattr and render blank
+        if len(columns) > 1 and all(col in Asset.model_fields for col in columns):
+            get_values = attrgetter(*columns)
+        else:
+            get_values = lambda asset: [getattr(asset, col, '') for col in columns]
         
-        # Alternate row colors
-        for i in range(1, len(table_data)):
-            if i % 2 == 0:
-                table_style.append(('BACKGROUND', (0, i), (-1, i), colors.HexColor('#fafafa')))
+        for asset in display_assets:
+            # Truncate long values
+            table_data.append([
+                text if len(text := str(value or '')) <= 30 else text[:27] + '...'
+                for value in get_values(asset)
+            ])
         
-        asset_table.setStyle(TableStyle(table_style))
+        # Create table; rows split across pages with the header repeated
+        col_width = (7 * inch) / len(self.config.tableColumns)
+        asset_table = Table(
+            table_data, colWidths=[col_width] * len(self.config.tableColumns),
+            repeatRows=1, splitByRow=1
+        )
+        asset_table.setStyle(_ASSET_TABLE_STYLE)
         story.append(asset_table)
         
         return story
@@ -546,48 +700,15 @@ class PDFExportService:
     
     def _calculate_statistics(self) -> Dict[str, int]:
         """Calculate summary statistics for the assets."""
-        # Filter assets to match dashboard (Active, Stock, Pending Rebuild only)
-        filtered_assets = [a for a in self.assets if a.status in ['Active', 'Stock', 'Pending Rebuild']]
-        
-        stats = {
-            'total': len(filtered_assets),
-            'active': len([a for a in filtered_assets if a.status == 'Active']),
-            'pending': len([a for a in filtered_assets if a.status == 'Pending Rebuild']),
-            'stock': len([a for a in filtered_assets if a.status == 'Stock'])
-        }
-        
-        return stats
-    
-    def _apply_table_filters(self) -> List[Asset]:
-        """Apply table filters to the asset list."""
-        if not self.config.tableFilters:
-            return self.assets
-        
-        filtered = self.assets
-        filters = self.config.tableFilters
-        
-        if filters.company:
-            filtered = [a for a in filtered if a.company and filters.company.lower() in a.company.lower()]
-        
-        if filters.manufacturer:
-            filtered = [a for a in filtered if a.manufacturer and filters.manufacturer.lower() in a.manufacturer.lower()]
-        
-        if filters.category:
-            filtered = [a for a in filtered if a.category and filters.category.lower() in a.category.lower()]
-        
-        if filters.model:
-            filtered = [a for a in filtered if a.model and filters.model.lower() in a.model.lower()]
-        
-        if filters.department:
-            filtered = [a for a in filtered if a.department and filters.department.lower() in a.department.lower()]
-        
-        if filters.searchQuery:
-            query = filters.searchQuery.lower()
-            filtered = [a for a in filtered if any([
-                a.asset_name and query in a.asset_name.lower(),
-                a.asset_tag and query in a.asset_tag.lower(),
-                a.serial and query in a.serial.lower(),
-                a.location and query in a.location.lower(),
-            ])]
-        
-        return filtered 
\ No newline at end of file
+        # Only Active, Stock and Pending Rebuild count, to match the dashboard
+        counts = self._status_counts
+        active = counts['Active']
+        pending = counts['Pending Rebuild']
+        stock = counts['Stock']
+        
+        return {
+            'total': active + pending + stock,
+            'active': active,
+            'pending': pending,
+            'stock': stock
+        }
\ No newline at end of file
@@ -4,9 +4,9 @@ Performance monitoring and circuit breaker utilities.
 import time
 import psutil
 import logging
+import threading
 from functools import wraps
 from typing import Callable, Any
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +17,8 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.failure_count = 0
-        self.last_failure_time = None
+        # time.monotonic_ns() of the last failure; immune to wall-clock changes
+        self.last_failure_time_ns = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
     
     def __call__(self, func: Callable) -> Callable:
@@ -41,9 +42,9 @@ class CircuitBreaker:
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
-        if self.last_failure_time is None:
+        if self.last_failure_time_ns is None:
             return True
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic_ns() - self.last_failure_time_ns >= self.recovery_timeout * 1_000_000_000
     
     def _on_success(self):
         """Reset failure count on successful call."""
@@ -53,35 +54,46 @@ class CircuitBreaker:
     def _on_failure(self):
         """Increment failure count and potentially open circuit."""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time_ns = time.monotonic_ns()
         
         if self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
             logger.warning(f"Circuit breaker opened after {self.failure_count} failures")
 
+# One handle on this process, reused by every monitored call
+_PROCESS = psutil.Process()
+_BYTES_PER_MB = 1024 * 1024
+
 def monitor_performance(func: Callable) -> Callable:
     """Decorator to monitor function performance and resource usage."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        initial_cpu_percent = process.cpu_percent()
+        start_time = time.perf_counter()
+        # Resource sampling reads /proc; skip what no enabled log line would use.
+        # RSS also feeds the high-memory warning, so it follows WARNING rather than INFO.
+        report = logger.isEnabledFor(logging.INFO)
+        sample_memory = logger.isEnabledFor(logging.WARNING)
+        if sample_memory:
+            initial_memory = _PROCESS.memory_info().rss / _BYTES_PER_MB
+        if report:
+            # Primes the counter; the next call reports CPU use since this one
+            _PROCESS.cpu_percent()
         
         try:
             result = func(*args, **kwargs)
             
             # Log performance metrics
-            end_time = time.time()
-            duration = end_time - start_time
-            final_memory = process.memory_info().rss / 1024 / 1024  # MB
-            memory_used = final_memory - initial_memory
-            final_cpu_percent = process.cpu_percent()
-            
-            logger.info(f"{func.__name__} performance:")
-            logger.info(f"  Duration: {duration:.2f}s")
-            logger.info(f"  Memory change: {memory_used:+.1f} MB")
-            logger.info(f"  CPU usage: {final_cpu_percent:.1f}%")
+            duration = time.perf_counter() - start_time
+            memory_used = 0.0
+            if sample_memory:
+                memory_used = _PROCESS.memory_info().rss / _BYTES_PER_MB - initial_memory
+            if report:
+                final_cpu_percent = _PROCESS.cpu_percent()
+                
+                logger.info(f"{func.__name__} performance:")
+                logger.info(f"  Duration: {duration:.2f}s")
+                logger.info(f"  Memory change: {memory_used:+.1f} MB")
+                logger.info(f"  CPU usage: {final_cpu_percent:.1f}%")
             
             # Warn on high resource usage
             if duration > 30:  # 30 second threshold
@@ -92,23 +104,62 @@ def monitor_performance(func: Callable) -> Callable:
             return result
             
         except Exception as e:
-            logger.error(f"{func.__name__} failed after {time.time() - start_time:.2f}s: {e}")
+            logger.error(f"{func.__name__} failed after {time.perf_counter() - start_time:.2f}s: {e}")
             raise
     
     return wrapper
 
+# CPU usage is sampled by a background daemon thread over this window, so a
+# load check reads the latest value instead of blocking to measure it
+_CPU_SAMPLE_INTERVAL = 2.0
+_last_cpu_percent = None
+_cpu_sampler = None
+_cpu_sampler_lock = threading.Lock()
+
+# disk_usage is a statvfs call; its result is reused for this many seconds
+_DISK_CACHE_TTL = 30.0
+_disk_cache = (0.0, None)
+
+def _sample_cpu():
+    """Sampler thread body: keep _last_cpu_percent current."""
+    global _last_cpu_percent
+    while True:
+        _last_cpu_percent = psutil.cpu_percent(interval=_CPU_SAMPLE_INTERVAL)
+
+def _cpu_percent() -> float:
+    """Latest system-wide CPU usage, starting the sampler thread on first use."""
+    global _cpu_sampler
+    with _cpu_sampler_lock:
+        if _cpu_sampler is None:
+            _cpu_sampler = threading.Thread(target=_sample_cpu, name="cpu-sampler", daemon=True)
+            _cpu_sampler.start()
+    if _last_cpu_percent is None:
+        # No background sample yet; measure this once in the foreground
+        return psutil.cpu_percent(interval=1)
+    return _last_cpu_percent
+
+def _disk_usage():
+    """Root filesystem usage, cached for _DISK_CACHE_TTL seconds."""
+    global _disk_cache
+    checked_at, disk = _disk_cache
+    now = time.monotonic()
+    if disk is None or now - checked_at >= _DISK_CACHE_TTL:
+        disk = psutil.disk_usage('/')
+        _disk_cache = (now, disk)
+    return disk
+
 def check_system_resources() -> dict:
     """Check current system resource usage."""
-    cpu_percent = psutil.cpu_percent(interval=1)
+    cpu_percent = _cpu_percent()
     memory = psutil.virtual_memory()
-    disk = psutil.disk_usage('/')
+    disk = _disk_usage()
     
     return {
         "cpu_percent": cpu_percent,
         "memory_percent": memory.percent,
         "memory_available_mb": memory.available / 1024 / 1024,
         "disk_percent": disk.percent,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": time.time()  # epoch seconds; format only where it is displayed
     }
 
 def is_system_under_load() -> bool:
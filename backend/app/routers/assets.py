@@ -1,25 +1,96 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 import logging
-from fastapi.responses import FileResponse
-from numpy.linalg import det
-from sqlalchemy import exc
+from fastapi.responses import StreamingResponse
+from sqlalchemy import exc, func, literal
 from sqlmodel import select, Session
 from datetime import datetime
-from tempfile import NamedTemporaryFile
-import json
+from typing import Callable, Dict, List, Optional
+from collections import OrderedDict
+from tempfile import SpooledTemporaryFile
 import os
-import pandas as pd
-from io import BytesIO
-from sqlmodel import select
-from ..snipeit import create_asset_in_snipeit, update_asset_in_snipeit
+import threading
+import time
+import orjson
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from ..snipeit import create_asset_in_snipeit, delete_asset_in_snipeit, update_asset_in_snipeit
 
-from ..db import get_session
-from ..models import Asset, ExportConfig, ExportHistory, AssetCreate, AssetUpdate
+from ..db import get_engine, get_session
+from ..models import Asset, AssetPage, ExportConfig, ExportHistory, AssetCreate, AssetUpdate, TableFilters
 from ..pdf_export_service import PDFExportService
+from ..filters import table_filter_criteria
+from ..fun_queries_service import FunQueriesService
+from ..export_history import export_history_writer
 
 router = APIRouter(prefix="/assets", tags=["assets"])
 logger = logging.getLogger(__name__)
 
+# Serialized bodies of the read endpoints: (endpoint, params) -> (cached_at, data version, body).
+# Asset reads are versioned by the shared data version, which every worker bumps with its
+# writes; export history by this process's export_history_writer.version, with the short
+# TTL bounding staleness from other processes' exports. A body cached at an older version
+# is replaced by the next build, so superseded versions don't pile up.
+_READ_CACHE_TTL = 10.0
+_READ_CACHE_MAXSIZE = 32
+_read_cache: "OrderedDict[tuple, tuple[float, int, bytes]]" = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+# Every column, selected as plain rows: the read endpoints serialize them
+# straight to JSON without building ORM instances
+_ASSET_COLUMNS = tuple(Asset.__table__.columns)  # type: ignore
+_EXPORT_HISTORY_COLUMNS = tuple(ExportHistory.__table__.columns)  # type: ignore
+
+
+def _row_dicts(rows) -> list:
+    """Result rows as dicts keyed by column name, ready for orjson."""
+    return [row._asdict() for row in rows]
+
+
+def _asset_data_version(session: Session) -> int:
+    """Shared version of the asset data. Read it before the rows, so a body is never older than its version."""
+    return FunQueriesService(session).shared_version()
+
+
+def _cached_json(key: tuple, version: int, build: Callable[[], bytes]) -> Response:
+    """JSON response for `key` at `version`, built by `build()` unless a fresh copy is cached."""
+    now = time.monotonic()
+    with _read_cache_lock:
+        cached = _read_cache.get(key)
+        if cached is not None and cached[1] == version and now - cached[0] < _READ_CACHE_TTL:
+            _read_cache.move_to_end(key)
+            return Response(content=cached[2], media_type="application/json")
+    body = build()
+    with _read_cache_lock:
+        _read_cache[key] = (now, version, body)
+        _read_cache.move_to_end(key)
+        while len(_read_cache) > _READ_CACHE_MAXSIZE:
+            _read_cache.popitem(last=False)
+    return Response(content=body, media_type="application/json")
+
+
+# Client-facing message for each unique constraint an asset INSERT can violate
+_CONSTRAINT_DETAILS = {
+    "asset_asset_tag_key": "Asset tag already exists",
+    "asset_pkey": "An asset with this Snipe-IT ID already exists",
+}
+
+
+def _integrity_error_detail(error: exc.IntegrityError) -> str:
+    """Name the violated constraint, as reported by the driver (psycopg's diag)."""
+    diag = getattr(error.orig, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    return _CONSTRAINT_DETAILS.get(constraint, "Asset conflicts with an existing record")
+
+
+def _delete_orphan_in_snipeit(snipeit_id: int) -> None:
+    """Undo a Snipe-IT create whose local insert failed; an asset that can't be removed is logged."""
+    try:
+        delete_asset_in_snipeit(snipeit_id)
+        logger.info(f"Deleted Snipe-IT asset {snipeit_id} after the local insert failed")
+    except Exception:
+        logger.exception(f"Orphaned Snipe-IT asset {snipeit_id}: the local insert failed and so did its delete")
+
+
 @router.post("/create", response_model=Asset)
 def create_asset(asset_data: AssetCreate, session: Session = Depends(get_session)):
 
@@ -32,11 +103,13 @@ def create_asset(asset_data: AssetCreate, session: Session = Depends(get_session
         Asset: The created asset with Snipe-IT ID
     """
     try:
-        # 1. Validate asset_tag uniqueness
+        # 1. Validate asset_tag uniqueness before anything is created in Snipe-IT
+        # (an ID-only probe answered from the unique index; the commit below
+        # still catches a tag taken in the meantime)
         existing = session.exec(
-            select(Asset).where(Asset.asset_tag == asset_data.asset_tag)
+            select(Asset.id).where(Asset.asset_tag == asset_data.asset_tag)
         ).first()
-        if existing:
+        if existing is not None:
             raise HTTPException(status_code=400,
             detail="Asset tag already exists"
             )
@@ -49,7 +122,15 @@ def create_asset(asset_data: AssetCreate, session: Session = Depends(get_session
             **asset_data.model_dump()
         )
         session.add(db_asset)
-        session.commit()
+        try:
+            FunQueriesService.invalidate(session)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            _delete_orphan_in_snipeit(snipeit_id)
+            if isinstance(e, exc.IntegrityError):
+                raise HTTPException(status_code=400, detail=_integrity_error_detail(e))
+            raise
         session.refresh(db_asset)
 
         logger.info(f"Created Asset: {db_asset.asset_tag} (ID: {snipeit_id})")
@@ -78,8 +159,7 @@ def update_assets(asset_id: int, asset_data: AssetUpdate, session: Session = Dep
     # Fetch existing asset from database
     existing_asset = session.get(Asset, asset_id)
     try:
-        # 1. Validate asset_tag uniqueness
-        existing = session.get(Asset, asset_id)
+        # 1. Check the asset exists
         if not existing_asset:
             raise HTTPException(
                 status_code=404,
@@ -91,12 +171,13 @@ def update_assets(asset_id: int, asset_data: AssetUpdate, session: Session = Dep
         if update_dict:
             # Convert to JSON-serializable format for Snipe-IT API
             update_dict_json = asset_data.model_dump(mode='json', exclude_unset=True)
-            snipeit_response = update_asset_in_snipeit(asset_id, update_dict_json)
+            update_asset_in_snipeit(asset_id, update_dict_json)
 
             # 4. Update the existing_asset objects fields with Python types
             for key, value in update_dict.items():
                 setattr(existing_asset, key, value)
             session.add(existing_asset)
+            FunQueriesService.invalidate(session)
             session.commit()
             session.refresh(existing_asset)
 
@@ -139,6 +220,7 @@ def delete_asset(asset_id: int, session: Session = Depends(get_session)):
         # 3. Update status to "Disposed" in local DB
         existing_asset.status = "Disposed"
         session.add(existing_asset)
+        FunQueriesService.invalidate(session)
         session.commit()
 
         logger.info(f"Marked asset as disposed: {existing_asset}")
@@ -158,10 +240,109 @@ def delete_asset(asset_id: int, session: Session = Depends(get_session)):
 
 
 @router.get("", response_model=list[Asset])
-def read_assets(session=Depends(get_session)):
-    """Get all assets for dashboard use."""
-    return session.exec(select(Asset)).all()
+def read_assets(
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    offset: int = Query(0, ge=0),
+    session=Depends(get_session)
+):
+    """
+    Get assets for dashboard use. Without a limit every asset is returned;
+    pass limit/offset to page through a large table instead.
+    """
+    def build() -> bytes:
+        statement = select(*_ASSET_COLUMNS)
+        if limit is not None:
+            # Stable order so consecutive pages don't overlap
+            statement = statement.order_by(Asset.id).offset(offset).limit(limit)
+        elif offset:
+            statement = statement.order_by(Asset.id).offset(offset)
+        return orjson.dumps(_row_dicts(session.exec(statement)))
     
+    if limit is None:
+        # The whole table: too big to keep a copy of
+        return Response(content=build(), media_type="application/json")
+    return _cached_json(("assets", limit, offset), _asset_data_version(session), build)
+
+
+def _iter_assets_ndjson():
+    """Yield every asset as NDJSON, one line per asset, fetched 500 rows at a time."""
+    # Own session: this runs while the response streams, not inside the request handler
+    with Session(get_engine()) as session:
+        statement = select(*_ASSET_COLUMNS)
+        result = session.exec(statement, execution_options={"yield_per": 500})
+        for rows in result.partitions():
+            yield b"".join(orjson.dumps(row._asdict()) + b"\n" for row in rows)
+
+
+@router.get("/stream")
+def stream_assets():
+    """All assets as newline-delimited JSON, streamed without loading the table into memory."""
+    return StreamingResponse(_iter_assets_ndjson(), media_type="application/x-ndjson")
+
+
+@router.get("/paginated", response_model=AssetPage)
+def read_assets_paginated(
+    after: Optional[int] = None,
+    limit: int = Query(100, ge=1),
+    skip: Optional[int] = Query(None, ge=0, deprecated=True, description="Use `after` instead"),
+    session=Depends(get_session)
+):
+    """
+    Get assets one page at a time, ordered by ID. Pass the previous page's
+    `next` as `after`; seeking past an ID costs the same at any depth,
+    unlike OFFSET which scans and discards every skipped row.
+
+    `skip` is still accepted from older clients and served with OFFSET; its
+    pages carry the same `next` cursor to continue with.
+    """
+    if skip is not None and after is not None:
+        raise HTTPException(status_code=422, detail="Pass either after or the deprecated skip, not both")
+    if limit > 500:  # Cap maximum limit
+        limit = 500
+    
+    def build() -> bytes:
+        statement = select(*_ASSET_COLUMNS).order_by(Asset.id).limit(limit)
+        if after is not None:
+            statement = statement.where(Asset.id > after)
+        elif skip:
+            statement = statement.offset(skip)
+        items = _row_dicts(session.exec(statement))
+        return orjson.dumps({"items": items, "next": items[-1]["id"] if len(items) == limit else None})
+    
+    return _cached_json(("paginated", after, skip, limit), _asset_data_version(session), build)
+
+
+@router.get("/count")
+def count_assets(
+    filters: TableFilters = Depends(),
+    status: Optional[List[str]] = Query(None),
+    session: Session = Depends(get_session)
+) -> Dict[str, int]:
+    """
+    Number of assets matching the table filters (and statuses, if given),
+    counted in SQL so callers can preflight an export without fetching rows.
+    """
+    criteria = table_filter_criteria(filters)
+    if status:
+        criteria.append(Asset.status.in_(status))  # type: ignore
+    statement = select(func.count()).select_from(Asset).where(*criteria)
+    return {"count": session.exec(statement).one()}
+
+
+@router.get("/export-history", response_model=list[ExportHistory])
+def get_export_history(session: Session = Depends(get_session)):
+    """Get export history records."""
+    # Rows recorded by this process may still be buffered; write them first
+    export_history_writer.flush()
+    return _cached_json(
+        ("export-history",),
+        export_history_writer.version,
+        lambda: orjson.dumps(_row_dicts(
+            session.exec(select(*_EXPORT_HISTORY_COLUMNS).limit(50))
+        )),
+    )
+
+
 @router.get("/{asset_id}", response_model=Asset)
 def get_asset(asset_id: int, session: Session = Depends(get_session)):
     """
@@ -176,18 +357,55 @@ def get_asset(asset_id: int, session: Session = Depends(get_session)):
     return asset
 
 
-@router.get("/paginated", response_model=list[Asset])
-def read_assets_paginated(
-    skip: int = 0, 
-    limit: int = 100, 
-    session=Depends(get_session)
-):
-    """Get assets with pagination to reduce memory usage."""
-    if limit > 500:  # Cap maximum limit
-        limit = 500
-    
-    statement = select(Asset).offset(skip).limit(limit)
-    return session.exec(statement).all()
+# Statuses included in the Excel export, matching the dashboard
+_EXCEL_EXPORT_STATUSES = ("Active", "Stock", "Pending Rebuild")
+
+
+def _no_assets(session: Session) -> bool:
+    """True when the asset table is empty (an export with no matches is still valid)."""
+    return session.exec(select(Asset.id).limit(1)).first() is None
+
+
+# Excel export layout: (header, Asset attribute) per column
+_EXCEL_COLUMNS = (
+    ("Asset Tag", "asset_tag"),
+    ("Asset Name", "asset_name"),
+    ("Category", "category"),
+    ("Manufacturer", "manufacturer"),
+    ("Model", "model"),
+    ("Model No", "model_no"),
+    ("Serial Number", "serial"),
+    ("Status", "status"),
+    ("Company", "company"),
+    ("Location", "location"),
+    ("Department", "department"),
+    ("Assigned User", "assigned_user_name"),
+    ("Warranty", "warranty"),
+    ("Warranty Expires", "warranty_expires"),
+    ("Created At", "created_at"),
+)
+# Display width of the formatted date columns
+_EXCEL_DATE_WIDTHS = {"warranty_expires": len("YYYY-MM-DD"), "created_at": len("YYYY-MM-DD HH:MM:SS")}
+# Workbooks up to this size stay in memory; larger ones spill to disk
+_EXCEL_SPOOL_MAX_SIZE = 10 * 1024 * 1024
+
+
+def _excel_width_columns():
+    """(column, fixed width) per Excel column; text columns are measured, dates have a fixed width."""
+    for _, name in _EXCEL_COLUMNS:
+        if name in _EXCEL_DATE_WIDTHS:
+            yield None, _EXCEL_DATE_WIDTHS[name]
+        else:
+            yield getattr(Asset, name), None
+
+
+def _iter_file(file, chunk_size: int = 64 * 1024):
+    """Yield a file's contents in chunks, closing it when done."""
+    try:
+        while chunk := file.read(chunk_size):
+            yield chunk
+    finally:
+        file.close()
 
 
 @router.post("/export-pdf")
@@ -203,121 +421,69 @@ def export_assets_pdf(
         session: Database session
     
     Returns:
-        FileResponse: PDF file download
+        StreamingResponse: PDF file download
     """
+    # One history row per request, recorded once however the export ends
+    history = ExportHistory(
+        config_json=config.model_dump_json(),
+        created_at=datetime.now().date(),
+        export_type="pdf",
+        status="failed"
+    )
     try:
         logger.info("Received export-pdf request", extra={
             'config': config.model_dump() if hasattr(config, 'model_dump') else str(config)
         })
-        # Get assets with streaming to reduce memory usage
-        # For exports, we still need all assets but process them in chunks
-        statement = select(Asset)
-        assets = session.exec(statement).all()
+        # Filter in SQL and stream the matches through a server-side cursor
+        # in batches of 500
+        statement = (
+            select(Asset)
+            .where(*table_filter_criteria(config.tableFilters))
+            .execution_options(stream_results=True, yield_per=500)
+        )
+        # The service reads the rows once as they stream in, keeping only
+        # what the report needs
+        pdf_service = PDFExportService(session.exec(statement), config, session)
         
-        if not assets:
+        if not pdf_service.asset_count and _no_assets(session):
             raise HTTPException(status_code=404, detail="No assets found")
         
-        # Apply any table filters to the asset list if specified
-        if config.tableFilters:
-            filtered_assets = []
-            for asset in assets:
-                include_asset = True
-                
-                # Apply filters
-                if config.tableFilters.company:
-                    if not asset.company or config.tableFilters.company.lower() not in asset.company.lower():
-                        include_asset = False
-                
-                if config.tableFilters.manufacturer:
-                    if not asset.manufacturer or config.tableFilters.manufacturer.lower() not in asset.manufacturer.lower():
-                        include_asset = False
-                
-                if config.tableFilters.category:
-                    if not asset.category or config.tableFilters.category.lower() not in asset.category.lower():
-                        include_asset = False
-                
-                if config.tableFilters.model:
-                    if not asset.model or config.tableFilters.model.lower() not in asset.model.lower():
-                        include_asset = False
-                
-                if config.tableFilters.department:
-                    if not asset.department or config.tableFilters.department.lower() not in asset.department.lower():
-                        include_asset = False
-                
-                if config.tableFilters.searchQuery:
-                    query = config.tableFilters.searchQuery.lower()
-                    search_fields = [
-                        asset.asset_name or '',
-                        asset.asset_tag or '',
-                        asset.serial or '',
-                        asset.location or ''
-                    ]
-                    if not any(query in field.lower() for field in search_fields):
-                        include_asset = False
-                
-                if include_asset:
-                    filtered_assets.append(asset)
-            
-            assets = filtered_assets
-        
         # Generate PDF using the service
-        pdf_service = PDFExportService(list(assets), config)
-        pdf_buffer = pdf_service.generate_pdf()
+        pdf_file = pdf_service.generate_pdf()
+        pdf_size = pdf_file.seek(0, os.SEEK_END)
+        pdf_file.seek(0)
         
-        # Save to temporary file for response
-        with NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(pdf_buffer.getvalue())
-            tmp_file_path = tmp_file.name
-        
-        # Save export history to database
-        try:
-            export_history = ExportHistory(
-                config_json=json.dumps(config.model_dump()),
-                file_size_bytes=len(pdf_buffer.getvalue()),
-                created_at=datetime.now().date(),
-                export_type="pdf",
-                status="completed"
-            )
-            session.add(export_history)
-            session.commit()
-        except Exception as e:
-            # Log error but don't fail the export
-            logger.exception("Failed to save export history", extra={'error': str(e)})
+        history.status = "completed"
+        history.file_size_bytes = pdf_size
         
         # Generate filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"asset_report_{timestamp}.pdf"
         
-        # Return file response with cleanup
-        return FileResponse(
-            path=tmp_file_path,
-            filename=filename,
-            media_type="application/pdf"
+        # Stream the spooled PDF in chunks; the file is closed once fully sent
+        return StreamingResponse(
+            _iter_file(pdf_file),
+            media_type="application/pdf",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(pdf_size),
+                "ETag": pdf_service.etag,
+            },
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception("PDF export failed", extra={
             'error': str(e),
             'config': config.model_dump() if hasattr(config, 'model_dump') else str(config)
         })
-        # Save failed export to history
-        try:
-            export_history = ExportHistory(
-                config_json=json.dumps(config.model_dump()),
-                file_size_bytes=0,
-                created_at=datetime.now().date(),
-                export_type="pdf",
-                status="failed"
-            )
-            session.add(export_history)
-            session.commit()
-        except Exception:
-            pass
-        
         raise HTTPException(
             status_code=500, 
             detail=f"PDF generation failed: {str(e)}"
         )
+    finally:
+        export_history_writer.record(history)
 
 
 @router.post("/export-excel")
@@ -333,160 +499,77 @@ def export_assets_excel(
         session: Database session
     
     Returns:
-        FileResponse: Excel file download
+        StreamingResponse: Excel file download
     """
+    # One history row per request, recorded once however the export ends
+    history = ExportHistory(
+        config_json=config.model_dump_json(),
+        created_at=datetime.now().date(),
+        export_type="excel",
+        status="failed"
+    )
     try:
-        # Get all assets
-        statement = select(Asset)
-        assets = session.exec(statement).all()
+        # Match the dashboard (Active, Stock, Pending Rebuild only) plus any
+        # table filters, all evaluated by the database
+        criteria = [
+            Asset.status.in_(_EXCEL_EXPORT_STATUSES),  # type: ignore
+            *table_filter_criteria(config.tableFilters),
+        ]
         
-        if not assets:
+        # Widths are needed before the first row is written, so measure the
+        # longest value per column in SQL instead of a pass over the cells
+        matched, *widths = session.exec(
+            select(func.count(), *(
+                func.max(func.length(column)) if column is not None else literal(width)
+                for column, width in _excel_width_columns()
+            )).where(*criteria)
+        ).one()
+        if not matched and _no_assets(session):
             raise HTTPException(status_code=404, detail="No assets found")
         
-        # Filter assets to match dashboard (Active, Stock, Pending Rebuild only)
-        filtered_assets = [a for a in assets if a.status in ['Active', 'Stock', 'Pending Rebuild']]
-        
-        # Apply additional table filters if specified
-        if config.tableFilters:
-            additional_filtered = []
-            for asset in filtered_assets:
-                include_asset = True
-                
-                if config.tableFilters.company:
-                    if not asset.company or config.tableFilters.company.lower() not in asset.company.lower():
-                        include_asset = False
-                
-                if config.tableFilters.manufacturer:
-                    if not asset.manufacturer or config.tableFilters.manufacturer.lower() not in asset.manufacturer.lower():
-                        include_asset = False
-                
-                if config.tableFilters.category:
-                    if not asset.category or config.tableFilters.category.lower() not in asset.category.lower():
-                        include_asset = False
-                
-                if config.tableFilters.model:
-                    if not asset.model or config.tableFilters.model.lower() not in asset.model.lower():
-                        include_asset = False
-                
-                if config.tableFilters.department:
-                    if not asset.department or config.tableFilters.department.lower() not in asset.department.lower():
-                        include_asset = False
-                
-                if config.tableFilters.searchQuery:
-                    query = config.tableFilters.searchQuery.lower()
-                    search_fields = [
-                        asset.asset_name or '',
-                        asset.asset_tag or '',
-                        asset.serial or '',
-                        asset.location or ''
-                    ]
-                    if not any(query in field.lower() for field in search_fields):
-                        include_asset = False
-                
-                if include_asset:
-                    additional_filtered.append(asset)
-            
-            filtered_assets = additional_filtered
-        
-        # Convert to pandas DataFrame
-        asset_data = []
-        for asset in filtered_assets:
-            asset_data.append({
-                'Asset Tag': asset.asset_tag or '',
-                'Asset Name': asset.asset_name or '',
-                'Category': asset.category or '',
-                'Manufacturer': asset.manufacturer or '',
-                'Model': asset.model or '', 
-                'Model No': asset.model_no or '',
-                'Serial Number': asset.serial or '',
-                'Status': asset.status or '',
-                'Company': asset.company or '',
-                'Location': asset.location or '',
-                'Department': asset.department or '',
-                'Assigned User': asset.assigned_user_name or '',
-                'Warranty': asset.warranty or '',
-                'Warranty Expires': asset.warranty_expires.strftime('%Y-%m-%d') if asset.warranty_expires else '',
-                'Created At': asset.created_at or ''
-            })
-        
-        df = pd.DataFrame(asset_data)
-        
-        # Create Excel file in memory
-        excel_buffer = BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Asset Details', index=False)
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Asset Details']
-            for column in worksheet.columns:
-                max_length = 0
-                column = [cell for cell in column]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Asset Details')
+        for index, ((header, _), width) in enumerate(zip(_EXCEL_COLUMNS, widths), start=1):
+            worksheet.column_dimensions[get_column_letter(index)].width = min(max(width or 0, len(header)) + 2, 50)
+        worksheet.append([header for header, _ in _EXCEL_COLUMNS])
         
-        excel_buffer.seek(0)
+        # Rows go straight from a server-side cursor into the write-only sheet;
+        # dates are written as native Excel dates, formatted by the cell style
+        statement = (
+            select(*(getattr(Asset, name) for _, name in _EXCEL_COLUMNS))
+            .where(*criteria)
+            .execution_options(stream_results=True, yield_per=1000)
+        )
+        for row in session.exec(statement):
+            worksheet.append(tuple(row))
         
-        # Save to temporary file for response
-        with NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            tmp_file.write(excel_buffer.getvalue())
-            tmp_file_path = tmp_file.name
+        excel_file = SpooledTemporaryFile(max_size=_EXCEL_SPOOL_MAX_SIZE)
+        workbook.save(excel_file)
+        excel_size = excel_file.tell()
+        excel_file.seek(0)
         
-        # Save export history to database
-        try:
-            export_history = ExportHistory(
-                config_json=json.dumps(config.model_dump()),
-                file_size_bytes=len(excel_buffer.getvalue()),
-                created_at=datetime.now().date(),
-                export_type="excel",
-                status="completed"
-            )
-            session.add(export_history)
-            session.commit()
-        except Exception as e:
-            print(f"Failed to save export history: {e}")
+        history.status = "completed"
+        history.file_size_bytes = excel_size
         
         # Generate filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"asset_details_{timestamp}.xlsx"
         
-        return FileResponse(
-            path=tmp_file_path,
-            filename=filename,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        return StreamingResponse(
+            _iter_file(excel_file),
+            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(excel_size),
+            },
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        # Save failed export to history
-        try:
-            export_history = ExportHistory(
-                config_json=json.dumps(config.model_dump()),
-                file_size_bytes=0,
-                created_at=datetime.now().date(),
-                export_type="excel",
-                status="failed"
-            )
-            session.add(export_history)
-            session.commit()
-        except Exception:
-            pass
-        
         raise HTTPException(
             status_code=500, 
             detail=f"Excel generation failed: {str(e)}"
         )
-
-
-@router.get("/export-history", response_model=list[ExportHistory])
-def get_export_history(session: Session = Depends(get_session)):
-    """Get export history records."""
-    return session.exec(
-        select(ExportHistory).limit(50)
-    ).all()
-
-
+    finally:
+        export_history_writer.record(history)
@@ -1,10 +1,12 @@
 """
 Fun Queries API endpoints - predefined queries for asset analysis
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session, select, func
 from typing import List, Dict, Any
 from datetime import date, timedelta
+import orjson
 
 from ..db import get_session
 from ..models import Asset
@@ -12,30 +14,85 @@ from ..fun_queries_service import FunQueriesService
 
 router = APIRouter(prefix="/fun-queries", tags=["fun-queries"])
 
+# Matches the service's result cache TTL
+_CACHE_CONTROL = "max-age=30"
+
+# The template catalogue is static, so it is serialized once and browsers may keep it
+_TEMPLATES_JSON = orjson.dumps(FunQueriesService.get_templates())
+_TEMPLATES_CACHE_CONTROL = "public, max-age=300"
+
+
+def get_fun_queries_service(session: Session = Depends(get_session)) -> FunQueriesService:
+    """One service per request; FastAPI reuses it for every dependant in that request."""
+    return FunQueriesService(session)
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """304 response if the client already holds the current version, else None."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return None
+
 
 @router.get("/templates")
-async def get_query_templates() -> Dict[str, Any]:
+async def get_query_templates() -> Response:
     """Get all available query templates organized by category."""
-    return FunQueriesService.get_templates()
+    return Response(
+        content=_TEMPLATES_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": _TEMPLATES_CACHE_CONTROL},
+    )
+
+
+@router.get("/data-quality-summary", response_class=ORJSONResponse)
+def get_data_quality_summary(
+    request: Request,
+    service: FunQueriesService = Depends(get_fun_queries_service)
+) -> Response:
+    """Count of assets failing each data-quality check, keyed by template id (runs in the threadpool)."""
+    etag = service.etag("data-quality-summary")
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    try:
+        return ORJSONResponse(
+            service.get_data_quality_summary(),
+            headers=_cache_headers(etag),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Query execution failed: {str(e)}")
 
 
-@router.get("/execute/{template_id}")
-async def execute_query(
+@router.get("/execute/{template_id}", response_class=ORJSONResponse)
+def execute_query(
     template_id: str,
-    session: Session = Depends(get_session)
-) -> Dict[str, Any]:
-    """Execute a predefined query template."""
-    service = FunQueriesService(session)
+    request: Request,
+    service: FunQueriesService = Depends(get_fun_queries_service)
+) -> Response:
+    """
+    Execute a predefined query template. A plain def: the ETag and the query
+    both hit the database, so FastAPI runs it in its threadpool.
+    """
+    etag = service.etag(template_id)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
     
     try:
         result = service.execute_query(template_id)
-        return {
+        # Returned directly so the rows skip jsonable_encoder and go straight to orjson
+        return ORJSONResponse({
             "success": True,
             "template_id": template_id,
             "template_name": service.get_template_name(template_id),
             "data": result,
             "count": len(result)
-        }
+        }, headers=_cache_headers(etag))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1,5 +1,5 @@
 # backend/app/routers/sync.py
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from ..sync import sync_snipeit_assets, sync_snipeit_users, sync_all
 from ..scheduler import sync_scheduler
 
@@ -10,30 +10,29 @@ def trigger_sync(background_tasks: BackgroundTasks):
     background_tasks.add_task(sync_snipeit_assets)
     return {"status": "scheduled"}
 
-@router.post("/sync/assets")
-def trigger_assets_sync(background_tasks: BackgroundTasks):
-    """Sync only assets from Snipe-IT."""
-    background_tasks.add_task(sync_snipeit_assets)
-    return {"status": "assets sync scheduled"}
-
-@router.post("/sync/users")
-def trigger_users_sync(background_tasks: BackgroundTasks):
-    """Sync only users from Snipe-IT."""
-    background_tasks.add_task(sync_snipeit_users)
-    return {"status": "users sync scheduled"}
-
-@router.post("/sync/all")
-def trigger_full_sync(background_tasks: BackgroundTasks):
-    """Sync both assets and users from Snipe-IT."""
-    background_tasks.add_task(sync_all)
-    return {"status": "full sync scheduled (assets + users)"}
-
 @router.post("/sync/now")
 def trigger_sync_now():
     """Manually trigger a sync job immediately."""
     sync_scheduler.trigger_sync_now()
     return {"status": "manual sync triggered"}
 
+# POST /sync/{target}: the job to schedule and the status message to return
+_SYNC_TARGETS = {
+    "assets": (sync_snipeit_assets, "assets sync scheduled"),
+    "users": (sync_snipeit_users, "users sync scheduled"),
+    "all": (sync_all, "full sync scheduled (assets + users)"),
+}
+
+@router.post("/sync/{target}")
+def trigger_target_sync(target: str, background_tasks: BackgroundTasks):
+    """Sync assets, users or both ("all") from Snipe-IT in the background."""
+    try:
+        job, status = _SYNC_TARGETS[target]
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown sync target: {target}")
+    background_tasks.add_task(job)
+    return {"status": status}
+
 @router.get("/sync/schedule")
 def get_sync_schedule():
     """Get the next scheduled sync times."""
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import select, Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import select, Session, func
+from typing import Optional
 
 from ..db import get_session
-from ..models import User, Asset
+from ..models import User, UserPage, Asset
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -22,28 +23,38 @@ def read_users(session: Session = Depends(get_session)):
             detail=f"Failed to fetch users: {str(e)}"
         )
 
-@router.get("/paginated", response_model=list[User])
+@router.get("/paginated", response_model=UserPage)
 def read_users_paginated(
-    skip: int = 0, 
+    after: Optional[int] = None, 
     limit: int = 100, 
+    skip: Optional[int] = Query(None, ge=0, deprecated=True, description="Use `after` instead"),
     session: Session = Depends(get_session)
 ):
     """
-    Get users with pagination to reduce memory usage.
+    Get users one page at a time, ordered by ID.
     
     Args:
-        skip: Number of records to skip
+        after: `next` from the previous page; omit for the first page
         limit: Maximum number of records to return (capped at 500)
+        skip: Deprecated offset from older clients, served with OFFSET
     
     Returns:
-        List[User]: List of users
+        UserPage: The users and the cursor for the next page
     """
+    if skip is not None and after is not None:
+        raise HTTPException(status_code=422, detail="Pass either after or the deprecated skip, not both")
     if limit > 500:  # Cap maximum limit
         limit = 500
         
     try:
-        statement = select(User).offset(skip).limit(limit)
-        return session.exec(statement).all()
+        # Seeking past the last ID costs the same at any depth, unlike OFFSET
+        statement = select(User).order_by(User.id).limit(limit)
+        if after is not None:
+            statement = statement.where(User.id > after)
+        elif skip:
+            statement = statement.offset(skip)
+        items = session.exec(statement).all()
+        return UserPage(items=items, next=items[-1].id if len(items) == limit else None)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -77,21 +88,23 @@ def read_user_assets(user_id: int, session: Session = Depends(get_session)):
     Returns:
         List[Asset]: List of assets assigned to the user
     """
-    # First check if user exists
-    user = session.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Get the user's full name
-    user_name = f"{user.first_name} {user.last_name}".strip()
-    
-    # Get assets assigned to this user by name
+    # Join on the user's full name so the assets come back in one query;
+    # the user is only looked up separately when there are none. A NULL name
+    # part counts as empty rather than turning the whole name NULL.
+    full_name = func.trim(func.coalesce(User.first_name, "") + " " + func.coalesce(User.last_name, ""))
     try:
-        statement = select(Asset).where(Asset.assigned_user_name == user_name)
+        statement = (
+            select(Asset)
+            .join(User, Asset.assigned_user_name == full_name)  # type: ignore
+            .where(User.id == user_id)
+        )
         assets = session.exec(statement).all()
-        return assets
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch user assets: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+    
+    if not assets and not session.get(User, user_id):
+        raise HTTPException(status_code=404, detail="User not found")
+    return assets
@@ -18,5 +18,13 @@ class Settings(BaseSettings):
     requests_ca_bundle: str | None = None
     echo_sql: bool = False
     postgres_password: str | None = None
+    # Connection pool sizing for the main engine
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800  # seconds
+    # Compiled SQL cache entries kept by the engine (SQLAlchemy default is 500)
+    db_query_cache_size: int = 1200
+    # Directory for rendered chart PNGs shared across workers and restarts (unset = memory only)
+    chart_cache_dir: str | None = None
         
 settings = Settings()  # type: ignore
\ No newline at end of file
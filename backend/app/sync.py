@@ -1,11 +1,13 @@
 # app/sync.py
 from sqlmodel import Session, select
-from .db import engine
+from .db import get_engine
 from .models import Asset, User
 from .snipeit import fetch_all_hardware, fetch_all_users, user_department_map
+from .fun_queries_service import FunQueriesService
 from .performance_monitor import monitor_performance, sync_circuit_breaker, is_system_under_load
 import time
 import html
+from datetime import datetime
 
 def flat_date(val: str | dict | None) -> str | None:
     if isinstance(val, dict):
@@ -13,13 +15,23 @@ def flat_date(val: str | dict | None) -> str | None:
     return val
 
 
+def parse_datetime(val: str | None) -> datetime | None:
+    """Parse a Snipe-IT "YYYY-MM-DD HH:MM:SS" datetime string (None if missing or malformed)."""
+    if not val:
+        return None
+    try:
+        return datetime.fromisoformat(val)
+    except ValueError:
+        return None
+
+
 def sync_snipeit_users():
     """Sync users from Snipe-IT API to local database with batch processing."""
     BATCH_SIZE = 50
     batch_count = 0
     processed_count = 0
     
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         user_batch = []
         
         for user_data in fetch_all_users():
@@ -75,7 +87,7 @@ def sync_snipeit_assets():
     
     
     
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         asset_batch = []
         
         for hw in fetch_all_hardware():
@@ -137,7 +149,7 @@ def sync_snipeit_assets():
                 company           = comp.get("name"),
                 warranty          = hw.get("warranty_months"),
                 warranty_expires  = flat_date(hw.get("warranty_expires")),
-                created_at        = crt.get("datetime")
+                created_at        = parse_datetime(crt.get("datetime"))
             )
             asset_batch.append(obj)
             processed_count += 1
@@ -213,6 +225,10 @@ def sync_snipeit_assets():
         
         print(f"  Total assets processed: {processed_count} in {batch_count} batches")
 
+        # Cached fun-query results and their ETags describe the pre-sync data
+        FunQueriesService.invalidate(session)
+        session.commit()
+
 
 @sync_circuit_breaker
 @monitor_performance
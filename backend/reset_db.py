@@ -1,9 +1,9 @@
 # backend/reset_db.py
 from sqlmodel import SQLModel
-from app.db import engine
+from app.db import get_engine
 from app import models
 
 # WARNING: this will erase all data in your asset table
-SQLModel.metadata.drop_all(engine)
-SQLModel.metadata.create_all(engine)
+SQLModel.metadata.drop_all(get_engine())
+SQLModel.metadata.create_all(get_engine())
 print("Dropped and re-created all tables.")
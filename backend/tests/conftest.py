@@ -0,0 +1,6 @@
+import os
+
+# app.settings reads these at import time; tests never talk to Snipe-IT
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SNIPEIT_API_URL", "http://snipeit.invalid/api/v1")
+os.environ.setdefault("SNIPEIT_TOKEN", "test-token")
@@ -0,0 +1,171 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, exc, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+import app.export_history
+from app.db import get_session
+from app.models import Asset, DataVersion
+from app.routers import assets
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(DataVersion(id=1, version=0))
+        session.add(Asset(id=1, asset_name="Laptop", asset_tag="A1", status="Active"))
+        session.commit()
+    monkeypatch.setattr(app.export_history, "get_engine", lambda: engine)
+    assets._read_cache.clear()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    api = FastAPI()
+    api.include_router(assets.router)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    api.dependency_overrides[get_session] = session_override
+    return TestClient(api)
+
+
+def test_update_sends_the_change_to_snipeit_before_the_local_update(client, engine, monkeypatch):
+    calls = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_update(conn, cursor, statement, *args):
+        if statement.startswith("UPDATE asset"):
+            calls.append("UPDATE asset")
+
+    monkeypatch.setattr(assets, "update_asset_in_snipeit", lambda asset_id, data: calls.append(data))
+    response = client.put("/assets/1", json={"status": "Repair"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "Repair"
+    assert calls == [{"status": "Repair"}, "UPDATE asset"]
+
+
+def test_update_rejected_by_snipeit_leaves_the_asset_unchanged(client, engine, monkeypatch):
+    def fail_update(asset_id, data):
+        raise RuntimeError("Snipe-IT unavailable")
+
+    monkeypatch.setattr(assets, "update_asset_in_snipeit", fail_update)
+
+    response = client.put("/assets/1", json={"status": "Repair"})
+
+    assert response.status_code == 500
+    with Session(engine) as session:
+        assert session.get(Asset, 1).status == "Active"
+
+
+@pytest.mark.parametrize("path", ["/assets/export-pdf", "/assets/export-excel"])
+def test_export_without_assets_is_404(client, engine, path):
+    with Session(engine) as session:
+        session.delete(session.get(Asset, 1))
+        session.commit()
+
+    response = client.post(path, json={})
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No assets found"
+
+
+def _integrity_error(constraint_name):
+    class Diag:
+        pass
+
+    class DriverError(Exception):
+        diag = Diag()
+
+    DriverError.diag.constraint_name = constraint_name
+    return exc.IntegrityError("INSERT INTO asset ...", {}, DriverError())
+
+
+@pytest.mark.parametrize("constraint_name, detail", [
+    ("asset_asset_tag_key", "Asset tag already exists"),
+    ("asset_pkey", "An asset with this Snipe-IT ID already exists"),
+    (None, "Asset conflicts with an existing record"),
+])
+def test_integrity_error_detail_names_the_constraint(constraint_name, detail):
+    assert assets._integrity_error_detail(_integrity_error(constraint_name)) == detail
+
+
+def test_create_deletes_the_snipeit_asset_when_the_insert_fails(client, monkeypatch):
+    deleted = []
+    # Snipe-IT hands out an ID that already exists locally
+    monkeypatch.setattr(assets, "create_asset_in_snipeit", lambda data: {"id": 1})
+    monkeypatch.setattr(assets, "delete_asset_in_snipeit", deleted.append)
+
+    response = client.post("/assets/create", json={"asset_tag": "A9"})
+
+    assert response.status_code == 400
+    assert deleted == [1]
+
+
+def test_create_logs_an_orphan_it_cannot_delete(client, monkeypatch, caplog):
+    def fail_delete(asset_id):
+        raise RuntimeError("Snipe-IT unavailable")
+
+    monkeypatch.setattr(assets, "create_asset_in_snipeit", lambda data: {"id": 1})
+    monkeypatch.setattr(assets, "delete_asset_in_snipeit", fail_delete)
+
+    response = client.post("/assets/create", json={"asset_tag": "A9"})
+
+    assert response.status_code == 400
+    assert "Orphaned Snipe-IT asset 1" in caplog.text
+
+
+def test_paginated_pages_follow_the_cursor(client, engine):
+    with Session(engine) as session:
+        session.add_all([Asset(id=2, asset_tag="A2"), Asset(id=3, asset_tag="A3")])
+        session.commit()
+
+    first = client.get("/assets/paginated", params={"limit": 2}).json()
+    second = client.get("/assets/paginated", params={"limit": 2, "after": first["next"]}).json()
+
+    assert [item["id"] for item in first["items"]] == [1, 2]
+    assert [item["id"] for item in second["items"]] == [3]
+    assert second["next"] is None
+
+
+def test_paginated_still_accepts_deprecated_skip(client, engine):
+    with Session(engine) as session:
+        session.add_all([Asset(id=2, asset_tag="A2"), Asset(id=3, asset_tag="A3")])
+        session.commit()
+
+    page = client.get("/assets/paginated", params={"limit": 1, "skip": 1}).json()
+
+    assert [item["id"] for item in page["items"]] == [2]
+    assert page["next"] == 2
+
+
+def test_paginated_rejects_skip_with_after(client):
+    response = client.get("/assets/paginated", params={"after": 1, "skip": 1})
+    assert response.status_code == 422
+
+
+def test_cached_pages_follow_changes_made_by_another_worker(client, engine):
+    assert [item["asset_tag"] for item in client.get("/assets/paginated").json()["items"]] == ["A1"]
+
+    # Another worker's edit: this process only sees the shared version change
+    with Session(engine) as session:
+        session.add(Asset(id=2, asset_tag="A2"))
+        session.execute(text("UPDATE data_version SET version = version + 1"))
+        session.commit()
+
+    assert [item["asset_tag"] for item in client.get("/assets/paginated").json()["items"]] == ["A1", "A2"]
+    assert len(assets._read_cache) == 1
+
+
+def test_full_asset_list_is_not_cached(client):
+    assert [item["asset_tag"] for item in client.get("/assets").json()] == ["A1"]
+    assert not assets._read_cache
@@ -0,0 +1,54 @@
+import os
+import time
+
+from app import chart_generator
+
+
+def test_shutdown_render_pool_stops_the_workers():
+    pool = chart_generator._get_render_pool()
+    assert pool.submit(abs, -3).result(timeout=60) == 3
+
+    chart_generator.shutdown_render_pool()
+
+    assert chart_generator._RENDER_POOL is None
+    assert not pool._processes
+    # A later render starts a fresh pool
+    assert chart_generator._get_render_pool() is not pool
+    chart_generator.shutdown_render_pool()
+
+
+def test_shutdown_render_pool_without_a_pool():
+    chart_generator.shutdown_render_pool()
+    assert chart_generator._RENDER_POOL is None
+
+
+def test_png_cache_key_includes_the_render_version():
+    key = chart_generator.ChartGenerator()._cache_key("trend", {"a": 1})
+    assert key[0] == chart_generator._RENDER_VERSION
+
+
+def test_png_cache_prunes_files_unused_past_max_age(tmp_path):
+    cache = chart_generator._PNGCache(directory=str(tmp_path), max_age=3600)
+    cache.put(("stale",), b"png")
+    cache.put(("used",), b"png")
+    hours_ago = time.time() - 7200
+    for key in (("stale",), ("used",)):
+        os.utime(cache._path(key), (hours_ago, hours_ago))
+    # Reading a file from disk marks it as used
+    cache._items.clear()
+    assert cache.get(("used",)) == b"png"
+
+    cache.prune()
+
+    assert os.listdir(tmp_path) == [os.path.basename(cache._path(("used",)))]
+
+
+def test_png_cache_prune_keeps_the_most_recent_files(tmp_path):
+    cache = chart_generator._PNGCache(directory=str(tmp_path), max_files=1)
+    cache.put(("old",), b"png")
+    os.utime(cache._path(("old",)), (time.time() - 60, time.time() - 60))
+    cache.put(("new",), b"png")
+
+    cache.prune()
+
+    assert os.listdir(tmp_path) == [os.path.basename(cache._path(("new",)))]
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, func, select
+
+import app.export_history
+from app.export_history import ExportHistoryWriter
+from app.models import ExportHistory
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(app.export_history, "get_engine", lambda: engine)
+    yield engine
+    engine.dispose()
+
+
+def test_flush_waits_for_a_batch_already_being_written(engine):
+    writer = ExportHistoryWriter()
+    inserting = threading.Event()
+    release = threading.Event()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def hold_insert(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO export_history"):
+            inserting.set()
+            release.wait(5)
+
+    writer._rows.append(ExportHistory(config_json="{}").model_dump(exclude={"id"}))
+    background = threading.Thread(target=writer.flush)
+    background.start()
+    assert inserting.wait(5)
+
+    # The buffer is empty now, but the row isn't committed yet
+    flushed = threading.Thread(target=writer.flush)
+    flushed.start()
+    flushed.join(0.2)
+    assert flushed.is_alive()
+
+    release.set()
+    flushed.join(5)
+    background.join(5)
+    with Session(engine) as session:
+        assert session.exec(select(func.count()).select_from(ExportHistory)).one() == 1
+    assert writer.version == 1
@@ -0,0 +1,91 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.db import get_session
+from app.fun_queries_service import FunQueriesService
+from app.models import Asset, DataVersion
+from app.routers import fun_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(DataVersion(id=1, version=0))
+        session.commit()
+    FunQueriesService._cache.clear()
+    yield engine
+    engine.dispose()
+
+
+def test_etag_and_cache_follow_changes_made_by_another_worker(engine):
+    with Session(engine) as session:
+        service = FunQueriesService(session)
+        etag = service.etag("missing_serial")
+        assert service.execute_query("missing_serial") == []
+
+    # Another worker adds an asset; only the shared version tells this process
+    with Session(engine) as session:
+        session.add(Asset(asset_tag="A1"))
+        session.execute(text("UPDATE data_version SET version = version + 1"))
+        session.commit()
+
+    with Session(engine) as session:
+        service = FunQueriesService(session)
+        assert service.etag("missing_serial") != etag
+        assert [row["asset_tag"] for row in service.execute_query("missing_serial")] == ["A1"]
+
+
+def test_invalidate_bumps_the_shared_version(engine):
+    with Session(engine) as session:
+        before = FunQueriesService(session).shared_version()
+        FunQueriesService.invalidate(session)
+        session.commit()
+    with Session(engine) as session:
+        assert FunQueriesService(session).shared_version() == before + 1
+
+
+def test_invalidate_creates_a_missing_version_row(engine):
+    with Session(engine) as session:
+        session.execute(text("DELETE FROM data_version"))
+        FunQueriesService.invalidate(session)
+        session.commit()
+    with Session(engine) as session:
+        assert FunQueriesService(session).shared_version() == 1
+
+
+@pytest.fixture
+def client(engine):
+    api = FastAPI()
+    api.include_router(fun_queries.router)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    api.dependency_overrides[get_session] = session_override
+    return TestClient(api)
+
+
+def test_execute_answers_304_for_the_current_etag(client):
+    response = client.get("/fun-queries/execute/missing_serial")
+    assert response.status_code == 200
+
+    cached = client.get("/fun-queries/execute/missing_serial", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+
+
+def test_data_quality_summary_counts_each_check(client, engine):
+    with Session(engine) as session:
+        session.add(Asset(asset_tag="A1", serial="S1"))
+        session.commit()
+
+    summary = client.get("/fun-queries/data-quality-summary").json()
+
+    assert summary["missing_serial"] == 0
+    assert summary["missing_location"] == 1
@@ -0,0 +1,29 @@
+import logging
+from types import SimpleNamespace
+
+from app import performance_monitor
+
+
+class FakeProcess:
+    """RSS grows by 200 MB between the two samples."""
+
+    def __init__(self):
+        self.rss = [100, 300]
+
+    def memory_info(self):
+        return SimpleNamespace(rss=self.rss.pop(0) * performance_monitor._BYTES_PER_MB)
+
+    def cpu_percent(self):
+        return 5.0
+
+
+def test_high_memory_warning_survives_warning_level_logging(monkeypatch, caplog):
+    monkeypatch.setattr(performance_monitor, "_PROCESS", FakeProcess())
+    # Alembic's fileConfig() disables existing loggers when the migration tests run first
+    monkeypatch.setattr(performance_monitor.logger, "disabled", False)
+    caplog.set_level(logging.WARNING, logger=performance_monitor.logger.name)
+
+    performance_monitor.monitor_performance(lambda: None)()
+
+    assert "high memory usage" in caplog.text
+    assert "performance:" not in caplog.text
@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.db import get_session
+from app.models import Asset, User
+from app.routers import users
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            User(id=1, first_name="Ada", last_name="Lovelace"),
+            User(id=2, first_name="Alan", last_name="Turing"),
+            User(id=3, first_name="Grace", last_name="Hopper"),
+            User(id=4, first_name="Cher", last_name=None),
+            Asset(id=1, asset_tag="A1", assigned_user_name="Ada Lovelace"),
+            Asset(id=2, asset_tag="A2", assigned_user_name="Cher"),
+        ])
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(engine):
+    api = FastAPI()
+    api.include_router(users.router)
+
+    def session_override():
+        with Session(engine) as session:
+            yield session
+
+    api.dependency_overrides[get_session] = session_override
+    return TestClient(api)
+
+
+def test_paginated_still_accepts_deprecated_skip(client):
+    page = client.get("/users/paginated", params={"limit": 1, "skip": 1}).json()
+
+    assert [item["id"] for item in page["items"]] == [2]
+    assert page["next"] == 2
+
+
+def test_paginated_rejects_skip_with_after(client):
+    response = client.get("/users/paginated", params={"after": 1, "skip": 1})
+    assert response.status_code == 422
+
+
+def test_user_assets_joined_on_full_name(client):
+    response = client.get("/users/1/assets")
+
+    assert response.status_code == 200
+    assert [asset["asset_tag"] for asset in response.json()] == ["A1"]
+
+
+def test_user_assets_for_a_user_without_last_name(client):
+    response = client.get("/users/4/assets")
+
+    assert response.status_code == 200
+    assert [asset["asset_tag"] for asset in response.json()] == ["A2"]
+
+
+def test_user_assets_for_a_user_without_assets(client):
+    response = client.get("/users/2/assets")
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_user_assets_for_an_unknown_user(client):
+    assert client.get("/users/99/assets").status_code == 404
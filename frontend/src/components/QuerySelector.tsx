@@ -18,6 +18,7 @@ interface QuerySelectorProps {
   selectedTemplate: string;
   onCategoryChange: (category: string) => void;
   onTemplateChange: (template: string) => void;
+  counts?: Record<string, number> | null;
 }
 
 export function QuerySelector({ 
@@ -25,7 +26,8 @@ export function QuerySelector({
   selectedCategory, 
   selectedTemplate, 
   onCategoryChange, 
-  onTemplateChange 
+  onTemplateChange,
+  counts
 }: QuerySelectorProps) {
   if (!templates) {
     return <div className="text-center text-slate-500">Loading templates...</div>;
@@ -80,6 +82,7 @@ export function QuerySelector({
               return (
                 <SelectItem key={templateKey} value={templateKey}>
                   {template.name}
+                  {counts?.[templateKey] !== undefined && ` (${counts[templateKey]})`}
                 </SelectItem>
               );
             }).filter(Boolean)}
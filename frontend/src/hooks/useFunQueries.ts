@@ -22,6 +22,7 @@ interface QueryResult {
 
 export function useFunQueries() {
   const [templates, setTemplates] = useState<Record<string, QueryCategory> | null>(null);
+  const [dataQualityCounts, setDataQualityCounts] = useState<Record<string, number> | null>(null);
   const [isLoading, setIsLoading] = useState(false);
   const [data, setData] = useState<QueryResult | null>(null);
   const [error, setError] = useState<Error | null>(null);
@@ -37,7 +38,18 @@ export function useFunQueries() {
       }
     };
 
+    // All five data-quality counts come back from a single aggregate query
+    const loadDataQualityCounts = async () => {
+      try {
+        const response = await api.get('/fun-queries/data-quality-summary');
+        setDataQualityCounts(response.data);
+      } catch (err) {
+        console.error('Failed to load data quality summary:', err);
+      }
+    };
+
     loadTemplates();
+    loadDataQualityCounts();
   }, []);
 
   const executeQuery = async (templateId: string) => {
@@ -57,6 +69,7 @@ export function useFunQueries() {
 
   return {
     templates,
+    dataQualityCounts,
     executeQuery,
     isLoading,
     data,
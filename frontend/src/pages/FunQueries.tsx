@@ -8,7 +8,7 @@ import { useFunQueries } from '@/hooks/useFunQueries';
 import { Database, Play, Download, BarChart3 } from 'lucide-react';
 
 export default function FunQueries() {
-  const { templates, executeQuery, isLoading, data, error } = useFunQueries();
+  const { templates, dataQualityCounts, executeQuery, isLoading, data, error } = useFunQueries();
   const [selectedTemplate, setSelectedTemplate] = useState<string>('');
   const [selectedCategory, setSelectedCategory] = useState<string>('');
 
@@ -94,6 +94,7 @@ export default function FunQueries() {
                   selectedTemplate={selectedTemplate}
                   onCategoryChange={setSelectedCategory}
                   onTemplateChange={setSelectedTemplate}
+                  counts={dataQualityCounts}
                 />
                 
                 <Button 